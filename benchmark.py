@@ -0,0 +1,186 @@
+"""Benchmark suite for per-frame update and draw costs
+
+Renders to an offscreen surface under SDL's dummy video driver and writes
+stable JSON so results from different runs can be compared.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+# Must be set before pygame initializes its video system
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy
+import pygame
+from constants import PLANT_TYPES
+from frame_clock import FrameClock
+from garden import Garden
+from plant import DETAIL_FULL, DETAIL_LEVELS, Seed, seed_atlas, sprite_cache
+from tools import ToolBar
+
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 600
+GARDEN_HEIGHT = int(SCREEN_HEIGHT * 7/8)
+TOOLBAR_HEIGHT = SCREEN_HEIGHT - GARDEN_HEIGHT
+FRAME_TIME = 1 / 60
+
+PHASES = ["update", "plant_draw", "seed_draw", "toolbar_draw", "weather"]
+
+def build_garden(count, plant_type, stage, use_store=False):
+    """Create a garden holding count plants of one type, all at the given stage"""
+    clock = FrameClock(start=0.0)
+    # Same layout and plants on every run
+    garden = Garden(SCREEN_WIDTH, GARDEN_HEIGHT, use_store=use_store, clock=clock, seed=0)
+    for _ in range(count):
+        garden.plant_seed(Seed(plant_type), garden.rng.randint(0, SCREEN_WIDTH), GARDEN_HEIGHT - 10)
+    for plant in garden.plants:
+        for _ in range(stage):
+            plant.grow()
+        garden.refresh_plant(plant)
+    return garden, clock
+
+def summarize(samples):
+    """Turn per-frame nanosecond samples into millisecond statistics"""
+    ms = [sample / 1e6 for sample in samples]
+    return {
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "median_ms": round(statistics.median(ms), 4),
+        "min_ms": round(min(ms), 4),
+        "max_ms": round(max(ms), 4),
+    }
+
+def run_case(surface, toolbar, count, plant_type, stage, frames, warmup, use_store, detail=DETAIL_FULL):
+    """Time every phase of frames frames for one garden configuration"""
+    garden, clock = build_garden(count, plant_type, stage, use_store)
+    # Rain and sun both on for the whole run; effects last longer than the simulated frames
+    garden.start_sun()
+    garden.start_rain()
+    garden.is_sunny = True
+    sprite_cache.clear()
+
+    samples = {phase: [] for phase in PHASES}
+    for frame in range(warmup + frames):
+        clock.step(FRAME_TIME)
+        surface.fill((135, 206, 235))
+
+        start = time.perf_counter_ns()
+        if garden.store is not None:
+            garden.update_store()
+        else:
+            garden.update_plants()
+        after_update = time.perf_counter_ns()
+        for plant in garden.plants:
+            plant.draw_plant(surface, detail=detail)
+        after_plants = time.perf_counter_ns()
+        for plant in garden.plants:
+            plant.draw_seeds(surface)
+        after_seeds = time.perf_counter_ns()
+        toolbar.draw(surface, [])
+        after_toolbar = time.perf_counter_ns()
+        garden.update_weather()
+        garden.draw_sun(surface)
+        garden.draw_rain(surface)
+        after_weather = time.perf_counter_ns()
+
+        if frame >= warmup:
+            samples["update"].append(after_update - start)
+            samples["plant_draw"].append(after_plants - after_update)
+            samples["seed_draw"].append(after_seeds - after_plants)
+            samples["toolbar_draw"].append(after_toolbar - after_seeds)
+            samples["weather"].append(after_weather - after_toolbar)
+
+    return {
+        "plant_type": plant_type,
+        "stage": stage,
+        "detail": detail,
+        "plants": count,
+        "seeds": sum(len(plant.seeds) for plant in garden.plants),
+        "phases": {phase: summarize(values) for phase, values in samples.items()},
+        "sprite_cache": sprite_cache.stats(),
+    }
+
+def case_key(case):
+    """Identify a case so it can be matched across result files"""
+    # Results from before detail levels existed were all drawn at full detail
+    return (case["plant_type"], case["stage"], case.get("detail", DETAIL_FULL), case["plants"])
+
+def compare(baseline, results, threshold):
+    """Print phases whose median got slower than threshold times the baseline"""
+    old_cases = {case_key(case): case for case in baseline["results"]}
+    regressions = 0
+    for case in results["results"]:
+        old = old_cases.get(case_key(case))
+        if old is None:
+            continue
+        for phase, timing in case["phases"].items():
+            old_median = old["phases"][phase]["median_ms"]
+            new_median = timing["median_ms"]
+            # Ignore phases too fast to measure reliably
+            if old_median >= 0.05 and new_median > old_median * threshold:
+                regressions += 1
+                print(f"REGRESSION {case['plant_type']} stage {case['stage']} detail {case['detail']} x{case['plants']} "
+                      f"{phase}: {old_median:.3f}ms -> {new_median:.3f}ms", file=sys.stderr)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark garden update and draw costs")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--species", nargs="+", default=PLANT_TYPES, choices=PLANT_TYPES)
+    parser.add_argument("--stages", type=int, nargs="+", default=[1, 2, 3, 4, 5, 6])
+    parser.add_argument("--details", type=int, nargs="+", default=[DETAIL_FULL], choices=DETAIL_LEVELS,
+                        help="levels of detail to draw plants with (0 full, 1 simple, 2 blob)")
+    parser.add_argument("--frames", type=int, default=60, help="measured frames per case")
+    parser.add_argument("--warmup", type=int, default=5, help="unmeasured frames per case")
+    parser.add_argument("--store", action="store_true", help="use the NumPy plant store")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.25, help="slowdown ratio counted as a regression")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    # Offscreen stand-in for the window, in the display's pixel format like the real screen
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    seed_atlas.build()
+    toolbar = ToolBar(SCREEN_WIDTH, TOOLBAR_HEIGHT, 0, GARDEN_HEIGHT)
+    for plant_type in PLANT_TYPES:
+        toolbar.seed_counts[plant_type] = 3
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": numpy.__version__,
+            "machine": platform.machine(),
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "store": args.store,
+        },
+        "results": [],
+    }
+    for count in args.counts:
+        for plant_type in args.species:
+            for stage in args.stages:
+                for detail in args.details:
+                    results["results"].append(run_case(surface, toolbar, count, plant_type, stage, args.frames,
+                                                       args.warmup, args.store, detail))
+
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if compare(baseline, results, args.threshold):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -28,4 +28,43 @@ COLORS = {
 }
 
 # Game settings
-NATURAL_GROWTH_TIME = 10  # Seconds between natural growth stages
\ No newline at end of file
+NATURAL_GROWTH_TIME = 10  # Seconds between natural growth stages
+PLANT_LIFETIME = (30, 60)  # Range of seconds a plant lives after maturity
+SEED_YIELD = (2, 4)  # Range of seeds a fully grown plant produces
+WORLD_WIDTH = 4000  # Width of the garden in pixels; the screen scrolls across it
+SCROLL_SPEED = 600  # Pixels per second the camera moves while an arrow key is held
+USE_PLANT_STORE = False  # Keep plant simulation state in NumPy arrays for very large gardens
+GARDEN_WIDTH = 800  # Width of headless gardens, the same as the game window
+GARDEN_HEIGHT = 525  # Height of headless gardens, the game window above the toolbar
+GARDEN_SEED = None  # Set to an integer to make plants grow the same way in every game
+# Garden updates per second of clock time, e.g. 20, independent of FRAME_RATE; None updates once per frame
+SIM_TICK_RATE = None
+SIM_MAX_TICKS = 5  # Most updates run before a frame is drawn; after longer stalls the garden falls behind
+
+# Rendering settings
+FRAME_RATE = 60  # Frames drawn per second at most; lower it on slow machines
+SPRITE_CACHE_SIZE = 512  # Max number of pre-rendered plant sprites kept in memory (0 disables the cache)
+LEAN_QUANTUM = 0.05  # Lean direction is rounded to this step so similar plants share a sprite
+SEED_ROTATION_BUCKETS = 8  # Number of pre-rendered rotations per seed type
+DIRTY_RECT_RENDERING = False  # Only redraw and update the screen areas that changed each frame
+DIRTY_RECT_GAP = 16  # Changed areas closer than this many pixels are redrawn together
+STEM_SEGMENTS = 20  # Bezier segments in the tallest stem; shorter stems use proportionally fewer
+MIN_STEM_SEGMENTS = 6  # Fewest segments any curved stem is drawn with
+SOIL_TILE_WIDTH = 256  # Soil texture is made in tiles this wide as they come into view
+RAIN_DROPS = 300  # Raindrops falling at once while it rains
+ADAPTIVE_DETAIL = True  # Draw plants simpler while drawing takes too long (see detail.py)
+DETAIL_DRAW_BUDGET = 0.5  # Share of each frame drawing may take before plants get simpler
+DETAIL_RECOVER = 0.5  # Drawing must drop below this share of the budget before detail comes back
+DETAIL_HOLD_FRAMES = 60  # Frames a level of detail is kept before it may change again
+
+# Save settings
+SAVE_FILE = "garden.sav"  # The garden is loaded from and saved to this file (None disables saving)
+AUTOSAVE_INTERVAL = 10  # Seconds between autosaves of the plants that changed
+
+# Recording settings
+RECORD_FILE = None  # Record every game's actions to this file for replay.py, e.g. "session.rec"
+
+# Profiling settings
+PROFILE_FRAMES = False  # Time each phase of every frame (see profiler.py)
+PROFILE_OVERLAY = True  # Show p50/p95/p99 phase times on screen while profiling; F3 toggles it
+PROFILE_TRACE = None  # File to write per-frame timings to as JSON lines, e.g. "frames.jsonl"
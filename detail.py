@@ -0,0 +1,55 @@
+from plant import DETAIL_LEVELS
+
+class DetailController:
+    """Picks how much detail plants are drawn with from how long drawing takes
+
+    Drawing time is smoothed over recent frames and compared with a share of
+    the frame time. Over budget, plants are drawn one level simpler; detail
+    only comes back once drawing is well under budget, and every level is kept
+    for a while before it may change again. If more detail turns out to be
+    too slow straight away, the wait before trying again doubles, so the level
+    settles instead of flipping back and forth.
+    """
+    def __init__(self, frame_time, budget=0.5, recover=0.5, hold_frames=60, smoothing=0.1):
+        self.budget = frame_time * budget  # Seconds drawing may take each frame
+        self.recover_below = self.budget * recover  # Seconds drawing must drop under for more detail
+        self.hold = hold_frames  # Frames a level is measured before it may change
+        self.retry_hold = hold_frames  # Frames before more detail is tried again; grows after failed tries
+        self.smoothing = smoothing  # Weight of the newest frame in the average
+        self.level = 0  # Index into DETAIL_LEVELS
+        self.average = None  # Smoothed draw time at the current level
+        self.frames = 0  # Frames drawn at the current level
+        self.raised = False  # Whether the last change added detail
+
+    @property
+    def detail(self):
+        """Level of detail plants should be drawn with"""
+        return DETAIL_LEVELS[self.level]
+
+    def update(self, draw_time):
+        """Add the seconds the last frame took to draw; returns the detail for the next frame"""
+        if self.average is None:
+            self.average = draw_time
+        else:
+            self.average += (draw_time - self.average) * self.smoothing
+        self.frames += 1
+        if self.frames < self.hold:
+            return self.detail
+
+        if self.average > self.budget and self.level < len(DETAIL_LEVELS) - 1:
+            # More detail was just tried and was too slow straight away: wait longer before the next try
+            if self.raised and self.frames < self.hold * 2:
+                self.retry_hold *= 2
+            else:
+                self.retry_hold = self.hold
+            self.change(1)
+        elif self.average < self.recover_below and self.level > 0 and self.frames >= self.retry_hold:
+            self.change(-1)
+        return self.detail
+
+    def change(self, step):
+        """Move step levels towards less detail and start measuring the new level"""
+        self.level += step
+        self.raised = step < 0
+        self.average = None
+        self.frames = 0
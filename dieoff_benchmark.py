@@ -0,0 +1,89 @@
+"""Time mass die-offs to check that removing plants stays linear
+
+Two cases for each plant count: the scissors sweep across a garden full of
+buds (every plant is removed at once), and every seed is picked up from a
+garden of dead plants (each plant is removed with its last seed). The time
+per plant should stay about the same as the count grows.
+
+Seeds are picked up twice: sweeping along the garden like a player, and in
+random order. Every click does the same work either way, but random clicks
+jump all over a working set that grows with the garden, so their time per
+plant creeps up with cache misses rather than with extra work.
+"""
+import argparse
+import json
+import random
+import time
+import pygame
+from constants import PLANT_TYPES
+from frame_clock import FrameClock
+from garden import CUT_RADIUS, Garden
+
+def build_garden(count, stage, width):
+    """Garden of count plants spread over width pixels, all grown to stage"""
+    rng = random.Random(0)
+    garden = Garden(width, 525, clock=FrameClock(start=0.0), seed=0)
+    garden.animate_effects = False  # Seeds land straight away
+    for _ in range(count):
+        plant = garden.create_plant(rng.choice(PLANT_TYPES), rng.uniform(0, width), 475)
+        for _ in range(stage):
+            plant.grow()
+        garden.add_plant(plant)
+    return garden
+
+def time_cut(count, width):
+    """Seconds to cut down count buds with a sweep of the scissors"""
+    garden = build_garden(count, 5, width)
+    start = time.perf_counter()
+    for x in range(0, width + CUT_RADIUS, CUT_RADIUS):
+        garden.cut_flowers(x, 475)
+    elapsed = time.perf_counter() - start
+    assert not garden.plants
+    return elapsed
+
+def time_collect(count, width, shuffle=False):
+    """Seconds to pick up every seed of count dead plants, removing each plant with its last seed
+
+    Seeds are clicked from left to right, or in random order with shuffle.
+    """
+    garden = build_garden(count, 6, width)
+    for plant in garden.plants:
+        plant.die()
+        garden.refresh_plant(plant)
+        garden.drop_seeds(plant)
+    seeds = sorted((seed.x, seed.y) for plant in garden.plants for seed in plant.seeds)
+    if shuffle:
+        random.Random(1).shuffle(seeds)
+    start = time.perf_counter()
+    for x, y in seeds:
+        garden.check_seed_click((x, y))
+    elapsed = time.perf_counter() - start
+    assert not garden.plants
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Time removing plants during mass die-offs")
+    parser.add_argument("--counts", type=int, nargs="+", default=[2000, 4000, 8000, 16000, 32000])
+    parser.add_argument("--density", type=float, default=0.5, help="plants per pixel of garden width")
+    args = parser.parse_args()
+    pygame.init()
+
+    results = []
+    for count in args.counts:
+        width = int(count / args.density)
+        cut = time_cut(count, width)
+        collect = time_collect(count, width)
+        collect_random = time_collect(count, width, shuffle=True)
+        results.append({
+            "plants": count,
+            "cut_ms": round(cut * 1000, 2),
+            "cut_us_per_plant": round(cut / count * 1e6, 2),
+            "collect_ms": round(collect * 1000, 2),
+            "collect_us_per_plant": round(collect / count * 1e6, 2),
+            "collect_random_ms": round(collect_random * 1000, 2),
+            "collect_random_us_per_plant": round(collect_random / count * 1e6, 2),
+        })
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
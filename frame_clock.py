@@ -0,0 +1,81 @@
+import time
+
+class FrameClock:
+    """Simulation clock that is read once per frame and shared by everything
+
+    The clock follows a monotonic time source, optionally scaled, and can be
+    paused or advanced by fixed steps for deterministic simulation.
+    """
+    def __init__(self, scale=1.0, start=None, source=time.monotonic):
+        self.source = source
+        self.scale = scale  # Simulated seconds per real second
+        self.paused = False
+        self.last_real = source()
+        self.now = self.last_real if start is None else start  # Current simulated time
+        self.delta = 0.0  # Simulated seconds covered by the last tick or step
+
+    def elapsed(self):
+        """Simulated seconds the real time since the last call is worth, without advancing"""
+        real = self.source()
+        elapsed = real - self.last_real
+        self.last_real = real
+        return 0.0 if self.paused else elapsed * self.scale
+
+    def tick(self):
+        """Advance by the scaled real time since the last tick and return the new time"""
+        self.delta = self.elapsed()
+        self.now += self.delta
+        return self.now
+
+    def step(self, dt):
+        """Advance by exactly dt simulated seconds, independent of real time"""
+        self.delta = dt
+        self.now += dt
+        return self.now
+
+    def pause(self):
+        """Stop simulated time from following real time"""
+        self.paused = True
+
+    def resume(self):
+        """Follow real time again without jumping over the paused period"""
+        self.paused = False
+        self.last_real = self.source()
+
+class FixedTimestep:
+    """Turns the time between frames into whole simulation steps of dt seconds
+
+    Time comes from clock, so its scale and pause apply. Time left over
+    after the last whole step is carried into the next frame; fraction says
+    how far it has got towards the next step, for drawing moving things in
+    between. After a long stall at most max_steps steps are handed out, so a
+    slow machine falls behind real time instead of spending ever longer
+    catching up.
+    """
+    def __init__(self, clock, rate, max_steps=5):
+        self.clock = clock
+        self.dt = 1 / rate
+        self.max_steps = max_steps
+        self.clock.elapsed()  # Start counting from now
+        self.accumulated = 0.0  # Simulated seconds not yet stepped
+
+    @property
+    def fraction(self):
+        """Share of a step that has built up since the last one, from 0 to 1"""
+        return self.accumulated / self.dt
+
+    def advance(self):
+        """Add the time since the last call and return how many steps are due"""
+        self.accumulated += self.clock.elapsed()
+        steps = int(self.accumulated / self.dt)
+        if steps > self.max_steps:
+            # Drop the time that cannot be caught up
+            steps = self.max_steps
+            self.accumulated = 0.0
+        else:
+            self.accumulated -= steps * self.dt
+        return steps
+
+    def step(self):
+        """Advance the clock by one step"""
+        return self.clock.step(self.dt)
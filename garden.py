@@ -1,153 +1,503 @@
+import numpy as np
 import pygame
 import random
-import time
-from plant import Plant, Seed
+from constants import RAIN_DROPS, SOIL_TILE_WIDTH
+from frame_clock import FrameClock
+from particles import ParticleSystem, make_sprite
+from plant import DETAIL_FULL, Plant, Seed, SEED_SPREAD, SPRITE_ANCHOR, SPRITE_SIZE, seed_atlas, unit_vectors
+from plant_store import PlantStore, StoredPlant
+from scheduler import GrowthScheduler
+from spatial import SortedIndex, SpatialGrid
+from sprites import to_display_format
+
+CLICK_TOLERANCE = 20  # Pixels around a seed that will count as a click
+CUT_RADIUS = 100  # Horizontal distance the scissors reach
+SEED_GRAVITY = 600  # Pixels per second squared for seeds falling from a dead plant
+SPARKLE_RATE = 60  # Sun sparkles emitted per second
+SUN_RAY_DIRECTIONS = unit_vectors(8)  # One ray every 45 degrees
+SOIL_DETAILS = 0.25  # Soil texture dots per pixel of garden width
+SEED_MARGIN = 12  # Half the width of a seed sprite drawn at any rotation
 
 class Garden:
-    def __init__(self, width, height):
+    """The garden world, which may be wider than the screen
+
+    Plants, seeds and clicks use world coordinates. The part of the world on
+    screen starts at camera_x and is view_width pixels wide; the sky, sun
+    and rain stay fixed on the screen.
+
+    All randomness comes from generators seeded from seed, so a garden given
+    the same seed and the same actions plays out the same way every time.
+    """
+    def __init__(self, width, height, use_store=False, clock=None, view_width=None, seed=None):
         self.width = width
         self.height = height
-        self.plants = []
+        self.view_width = width if view_width is None else min(view_width, width)
+        self.camera_x = 0
+        # Shared simulation clock; whoever drives the garden ticks it once per frame
+        self.clock = clock if clock is not None else FrameClock()
+        # Hands every new plant the seed of its own random streams; the seed is
+        # kept so a recorded session can rebuild the same garden
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.rng = random.Random(self.seed)
+        # Plants in the order they were added; a dict, so removing one is O(1)
+        self.plants = {}
+        # Optional array-backed store that updates all plants in a few vectorized steps
+        self.store = PlantStore() if use_store else None
+        # Otherwise only plants whose next growth or death deadline has passed are updated
+        self.scheduler = GrowthScheduler()
         self.soil_color = (139, 69, 19)  # Brown for soil
         self.soil_rect = pygame.Rect(0, height - 50, width, 50)
         self.last_action = None  # Keep track of the last action (water or sun)
+        # Water and sun presses so far. A press only counts them; each plant
+        # applies the presses it missed when it is next updated, drawn or looked at
+        self.boosts = 0
+        self.store_boosts = 0  # Presses already applied to every row of the store
         
-        # Create soil texture
-        self.soil_texture = pygame.Surface((width, 50))
-        self.soil_texture.fill(self.soil_color)
-        for _ in range(200):  # More soil details
-            x = random.randint(0, width - 1)
-            y = random.randint(0, 49)
-            pygame.draw.circle(self.soil_texture, (101, 67, 33), (x, y), random.randint(1, 3))
+        # Soil texture tiles, created the first time they scroll into view
+        self.soil_tiles = {}
+        self.soil_seed = self.rng.getrandbits(32)
         
         # Weather effects
         self.is_raining = False
         self.is_sunny = False
         self.effect_timer = 0
         self.effect_duration = 3  # seconds
-        self.raindrops = []
         self.sun_rays = []
+        
+        # Particles for rain, sun sparkles and seeds falling from dead plants
+        rng = np.random.default_rng(self.rng.getrandbits(64))
+        self.rain = ParticleSystem(
+            [make_sprite((2, 11), lambda sprite: pygame.draw.line(sprite, (100, 150, 255), (0, 0), (0, 10), 2))],
+            capacity=RAIN_DROPS, bounds=pygame.Rect(0, 0, self.view_width, height), wrap=True, rng=rng)
+        self.sparkles = ParticleSystem(
+            [make_sprite((4, 4), lambda sprite: pygame.draw.circle(sprite, (255, 255, 200), (2, 2), 2))],
+            rng=rng)
+        self.falling_seeds = ParticleSystem(gravity=SEED_GRAVITY, rng=rng)
+        self.falling_seed_sprites = {}  # (seed type, rotation bucket) -> falling_seeds sprite index
+        self.landing_seeds = []  # (landing time, seed, area it falls through)
+        self.animate_effects = True  # Headless runs switch particle animation off
+        # How far particles are drawn from their positions before the last update (0) to the latest (1)
+        self.blend = 1.0
+        
+        # Spatial indexes so clicks and cuts only look at nearby objects
+        self.seed_index = SpatialGrid(CLICK_TOLERANCE * 2)
+        self.plant_index = SortedIndex()  # Plants never move, so they are indexed by x only
+        self.seed_owners = {}  # seed -> plant that dropped it
+        
+        # Plants whose saved state is out of date; None until an autosaver starts tracking them
+        self.changed_plants = None
+        
+        # Screen areas that changed since the last draw, for dirty-rect rendering
+        self.rect = pygame.Rect(0, 0, self.view_width, height)
+        self.sun_rect = pygame.Rect(self.view_width - 200, 0, 200, 200)  # Sun plus its longest rays
+        self.track_dirty = False  # Switched on by whoever renders with dirty rects
+        self.dirty_rects = [self.rect]
+        
+        # How much detail plants are drawn with (one of plant.DETAIL_LEVELS)
+        self.detail = DETAIL_FULL
     
     def plant_seed(self, seed, x, y):
         """Plant a seed at the given position"""
         # Make sure the seed is planted in the soil
         if y > self.height - 60:
-            plant_x = x
             plant_y = self.height - 50  # Top of soil
-            self.plants.append(Plant(seed.plant_type, plant_x, plant_y))
+            self.add_plant(self.create_plant(seed.plant_type, x, plant_y))
+    
+    def create_plant(self, plant_type, x, y, random_seed=None, traits=None):
+        """Create a plant backed by this garden's simulation, without adding it
+
+        Saved plants pass their random seed and traits; new ones get a seed from the garden.
+        """
+        if random_seed is None:
+            random_seed = self.rng.getrandbits(32)
+        if self.store is not None:
+            return StoredPlant(self.store, plant_type, x, y, self.clock.now, random_seed, traits)
+        return Plant(plant_type, x, y, self.clock.now, random_seed, traits)
+    
+    def add_plant(self, plant):
+        """Add a plant, and any seeds it already has, to the garden"""
+        self.plants[plant] = None
+        plant.boost_epoch = self.boosts  # Presses made before it was planted pass it by
+        if self.store is None:
+            self.scheduler.schedule(plant)
+        self.plant_index.insert(plant, plant.x)
+        self.refresh_plant(plant)
+    
+    def add_plants(self, plants):
+        """Add many plants at once, keeping the presses each has seen, as when loading a save
+
+        The plant index is sorted once and the whole view is redrawn, instead
+        of inserting and marking every plant and seed on its own.
+        """
+        self.plants.update(dict.fromkeys(plants))
+        if self.store is None:
+            for plant in plants:
+                self.scheduler.schedule(plant)
+        self.plant_index.extend((plant, plant.x) for plant in plants)
+        for plant in plants:
+            for seed in plant.seeds:
+                self.seed_index.insert(seed, seed.x, seed.y)
+                self.seed_owners[seed] = plant
+        if self.changed_plants is not None:
+            self.changed_plants.update(plants)
+        self.mark_dirty(self.rect)
+    
+    def refresh_plant(self, plant):
+        """(Re)index a plant's seeds and mark it for redraw after it changed"""
+        self.mark_changed(plant)
+        self.mark_world_dirty(plant.bounds())
+        for seed in plant.seeds:
+            self.seed_index.insert(seed, seed.x, seed.y)
+            self.seed_owners[seed] = plant
+            self.mark_world_dirty(seed.bounds())
+    
+    def mark_changed(self, plant):
+        """Remember that a plant needs saving again"""
+        if self.changed_plants is not None:
+            self.changed_plants.add(plant)
+    
+    def mark_dirty(self, rect):
+        """Remember that an area of the screen needs redrawing"""
+        if self.track_dirty:
+            self.dirty_rects.append(rect)
+    
+    def mark_world_dirty(self, rect):
+        """Remember that an area of the world needs redrawing, if it is on screen"""
+        if self.track_dirty:
+            rect = rect.move(-self.camera_x, 0).clip(self.rect)
+            if rect:
+                self.dirty_rects.append(rect)
+    
+    def scroll(self, dx):
+        """Move the camera dx pixels to the right, staying inside the world"""
+        camera_x = max(0, min(self.width - self.view_width, round(self.camera_x + dx)))
+        if camera_x != self.camera_x:
+            self.camera_x = camera_x
+            self.mark_dirty(self.rect)
+    
+    def set_detail(self, detail):
+        """Draw plants at another level of detail from now on"""
+        if detail != self.detail:
+            self.detail = detail
+            self.mark_dirty(self.rect)
+    
+    def interpolate(self, blend):
+        """Draw moving effects blend of the way from their previous update to their latest one"""
+        self.blend = blend
+        # Drawn in new places even if the garden did not update this frame
+        if self.is_raining:
+            self.mark_dirty(self.rect)
+        if self.is_sunny:
+            self.mark_dirty(self.sun_rect)
+        for _, _, area in self.landing_seeds:
+            self.mark_world_dirty(area)
+    
+    def to_world(self, pos):
+        """World position of a point on the screen"""
+        return (pos[0] + self.camera_x, pos[1])
+    
+    def take_dirty_rects(self):
+        """Return the areas changed since the last call and start a new list"""
+        rects = self.dirty_rects
+        self.dirty_rects = []
+        return rects
+    
+    def remove_plant(self, plant):
+        """Remove a plant and its index entries from the garden"""
+        del self.plants[plant]
+        self.plant_index.remove(plant)
+        self.mark_changed(plant)
+        self.mark_world_dirty(plant.bounds())
+        self.scheduler.unschedule(plant)
+        if self.store is not None:
+            self.store.release(plant)
+        for seed in plant.seeds:
+            self.seed_index.remove(seed)
+            self.seed_owners.pop(seed, None)
+            self.mark_world_dirty(seed.bounds())
     
     def water_plants(self):
         """Water all plants in the garden and start rain effect"""
         if self.last_action != "water":
-            for plant in self.plants:
-                plant.water()
+            # Every plant's water level changes, as plants catch up
+            self.boosts += 1
             self.last_action = "water"
-            
-            # Start rain effect
-            self.is_raining = True
-            self.is_sunny = False
-            self.effect_timer = time.time()
-            
-            # Create raindrops
-            self.raindrops = []
-            for _ in range(50):
-                x = random.randint(0, self.width)
-                y = random.randint(-50, 0)
-                speed = random.randint(5, 15)
-                self.raindrops.append({"x": x, "y": y, "speed": speed})
+            self.start_rain()
+    
+    def start_rain(self):
+        """Start the rain effect"""
+        if self.is_sunny:
+            self.mark_dirty(self.sun_rect)
+        self.is_raining = True
+        self.is_sunny = False
+        self.effect_timer = self.clock.now
+        
+        # Create raindrops
+        rng = self.rain.rng
+        self.rain.clear()
+        self.rain.emit(rng.uniform(0, self.view_width, RAIN_DROPS),
+                       rng.uniform(-50, 0, RAIN_DROPS),
+                       vy=rng.uniform(300, 900, RAIN_DROPS))  # Pixels per second
     
     def provide_sunlight(self):
         """Provide sunlight to all plants and start sun effect"""
         if self.last_action != "sun":
-            for plant in self.plants:
-                plant.provide_sunlight()
+            # Every plant's sun level changes, as plants catch up
+            self.boosts += 1
             self.last_action = "sun"
-            
-            # Start sun effect
-            self.is_sunny = True
-            self.is_raining = False
-            self.effect_timer = time.time()
-            
-            # Create sun rays
-            self.sun_rays = []
-            sun_x = self.width - 100  # Position near the sun button
-            sun_y = 100
-            for i in range(8):
-                angle = i * 45
-                length = random.randint(50, 100)
-                self.sun_rays.append({"angle": angle, "length": length, "sun_x": sun_x, "sun_y": sun_y})
+            self.start_sun()
+    
+    def catch_up(self, plants):
+        """Apply the water and sun presses that plants have not seen yet"""
+        if self.store is not None:
+            # The store applies each press to all its rows at once
+            while self.store_boosts < self.boosts:
+                self.store_boosts += 1
+                # Presses alternate, so every other one back from the latest was the same button
+                water = (self.last_action == "water") == ((self.boosts - self.store_boosts) % 2 == 0)
+                for plant in self.store.boost("water_level" if water else "sun_level", self.store_boosts):
+                    self.refresh_plant(plant)
+            return
+        boosts = self.boosts
+        for plant in plants:
+            if plant.boost_epoch != boosts:
+                stage = plant.growth_stage
+                plant.catch_up(boosts, self.last_action)
+                if plant.growth_stage != stage:
+                    self.refresh_plant(plant)
+    
+    def start_sun(self):
+        """Start the sun effect"""
+        if self.is_raining:
+            self.mark_dirty(self.rect)
+        self.mark_dirty(self.sun_rect)
+        self.is_sunny = True
+        self.is_raining = False
+        self.effect_timer = self.clock.now
+        
+        # Create sun rays
+        self.sun_rays = []
+        sun_x = self.view_width - 100  # Position near the sun button
+        sun_y = 100
+        lengths = self.sparkles.rng.integers(50, 101, len(SUN_RAY_DIRECTIONS))
+        for direction, length in zip(SUN_RAY_DIRECTIONS, lengths.tolist()):
+            self.sun_rays.append({"direction": direction, "length": length, "sun_x": sun_x, "sun_y": sun_y})
     
     def check_seed_click(self, pos):
         """Check if a seed was clicked and return it if so"""
-        # Increased detection radius for easier clicking
-        click_tolerance = 20  # Pixels around the seed that will count as a click
+        # Plants near the click may have grown seeds from presses they have not applied yet
+        self.catch_up(self.plant_index.query_range(pos[0] - SEED_SPREAD - CLICK_TOLERANCE,
+                                                   pos[0] + SEED_SPREAD + CLICK_TOLERANCE))
+        # Pick the closest seed within the click tolerance
+        closest = None
+        closest_distance = None
+        for seed, distance_squared in self.seed_index.query_radius(pos[0], pos[1], CLICK_TOLERANCE):
+            if closest is None or distance_squared < closest_distance:
+                closest = seed
+                closest_distance = distance_squared
         
-        for plant in self.plants:
-            # Check both alive and dead plants' seeds
-            for seed in plant.seeds:
-                # Calculate distance between click and seed center
-                dx = seed.x - pos[0]
-                dy = seed.y - pos[1]
-                distance = (dx * dx + dy * dy) ** 0.5  # Pythagorean distance
-                
-                # If click is within tolerance radius, count as a click
-                if distance <= click_tolerance:
-                    plant.seeds.remove(seed)
-                    return seed
-        return None
+        if closest is None:
+            return None
+        
+        self.seed_index.remove(closest)
+        self.mark_world_dirty(closest.bounds())
+        plant = self.seed_owners.pop(closest)
+        # Swap-remove: the last seed takes the picked one's place
+        seeds = plant.seeds
+        i = seeds.index(closest)
+        seeds[i] = seeds[-1]
+        seeds.pop()
+        self.mark_changed(plant)
+        # Dead plants are cleared once their last seed is picked up
+        if not plant.alive and not plant.seeds:
+            self.remove_plant(plant)
+        return closest
     
     def cut_flowers(self, x, y):
         """Cut down all fully grown flowers near the given position"""
-        cut_radius = 100  # Increased distance for easier cutting
-        
-        for plant in self.plants[:]:  # Use a copy to safely modify the list
+        # Only plants within cutting radius horizontally are looked at (ignore vertical position)
+        nearby = self.plant_index.query_range(x - CUT_RADIUS, x + CUT_RADIUS)
+        self.catch_up(nearby)
+        for plant in nearby:
             # Only cut mature plants (stage 5 or 6)
             if plant.growth_stage >= 5 and plant.alive:
-                # Calculate horizontal distance to the scissors (ignoring vertical)
-                dx = abs(plant.x - x)
-                
-                # If plant is within cutting radius horizontally (ignore vertical position)
-                if dx <= cut_radius:
-                    # Don't collect seeds automatically - let them drop to the ground
-                    # Trigger plant death - seeds will fall naturally
-                    plant.die()
+                # Don't collect seeds automatically - let them drop to the ground
+                # Trigger plant death - seeds will fall naturally
+                plant.die()
+                self.refresh_plant(plant)
+                self.drop_seeds(plant)
+                # Buds have no seeds, so there is nothing left to collect
+                if not plant.seeds:
+                    self.remove_plant(plant)
         
         # No seeds returned - they'll stay on the ground for manual collection
         return []
     
     def update(self):
         """Update all plants in the garden and weather effects"""
+        # Plants on screen catch up on water and sun before they are drawn
+        self.catch_up(self.plant_index.query_range(self.camera_x - SPRITE_SIZE[0] + SPRITE_ANCHOR[0],
+                                                   self.camera_x + self.view_width + SPRITE_ANCHOR[0]))
         # Update plants
-        for plant in self.plants[:]:  # Use a copy of the list to safely modify the original
-            plant.update()
-            
-            # If plant is dead and has no seeds, remove it
-            if not plant.alive and not plant.seeds:
-                self.plants.remove(plant)
-        
-        # Update weather effects
-        current_time = time.time()
+        if self.store is not None:
+            self.update_store()
+        else:
+            self.update_plants()
+        self.update_weather()
+    
+    def update_weather(self):
+        """Expire weather effects and move raindrops"""
+        current_time = self.clock.now
         if (self.is_raining or self.is_sunny) and current_time - self.effect_timer > self.effect_duration:
+            # Clear whatever the effect covered
+            self.mark_dirty(self.rect if self.is_raining else self.sun_rect)
             self.is_raining = False
             self.is_sunny = False
+            self.rain.clear()
+            self.sparkles.clear()
+        
+        if not self.animate_effects:
+            return
+        dt = self.clock.delta
         
         # Update raindrops
         if self.is_raining:
-            for drop in self.raindrops:
-                drop["y"] += drop["speed"]
-                # Reset raindrop if it goes offscreen
-                if drop["y"] > self.height:
-                    drop["y"] = random.randint(-50, 0)
-                    drop["x"] = random.randint(0, self.width)
+            # Rain covers the whole garden and moves every frame
+            self.mark_dirty(self.rect)
+            self.rain.update(dt)
+        
+        # Update sun sparkles, drifting outwards from the edge of the sun
+        if self.is_sunny:
+            self.mark_dirty(self.sun_rect)
+            rng = self.sparkles.rng
+            count = rng.poisson(SPARKLE_RATE * dt)
+            if count:
+                angle = rng.uniform(0, 2 * np.pi, count)
+                speed = rng.uniform(30, 60, count)
+                self.sparkles.emit(self.view_width - 100 + 40 * np.cos(angle), 100 + 40 * np.sin(angle),
+                                   speed * np.cos(angle), speed * np.sin(angle),
+                                   rng.uniform(0.3, 0.8, count))
+            self.sparkles.update(dt)
+        
+        # Update falling seeds, showing each seed again once it has landed
+        if self.landing_seeds:
+            self.falling_seeds.update(dt)
+            still_falling = []
+            for landing in self.landing_seeds:
+                land_time, seed, area = landing
+                self.mark_world_dirty(area)
+                if land_time <= current_time:
+                    seed.falling = False
+                else:
+                    still_falling.append(landing)
+            self.landing_seeds = still_falling
+    
+    def drop_seeds(self, plant):
+        """Animate a dead plant's seeds falling from the flower to where they landed"""
+        if not self.animate_effects:
+            return
+        start_y = plant.y - 100  # Roughly where the flower was
+        for seed in plant.seeds:
+            key = (seed.plant_type, seed.atlas_bucket)
+            sprite = self.falling_seed_sprites.get(key)
+            if sprite is None:
+                sprite = self.falling_seeds.add_sprite(seed_atlas.get(*key)[0])
+                self.falling_seed_sprites[key] = sprite
+            
+            # Time to fall from rest to the landing spot
+            fall_time = (2 * max(seed.y - start_y, 0) / SEED_GRAVITY) ** 0.5
+            self.falling_seeds.emit(seed.x, start_y, lifetime=fall_time, sprite=sprite)
+            seed.falling = True
+            area = pygame.Rect(seed.x - 12, start_y - 12, 24, seed.y - start_y + 24)
+            self.landing_seeds.append((self.clock.now + fall_time, seed, area))
+    
+    def update_plants(self):
+        """Update only the plants that have a growth or death event due"""
+        current_time = self.clock.now
+        due = self.scheduler.pop_due(current_time)
+        # Presses came before this update, so they are applied first
+        self.catch_up(due)
+        for plant in due:
+            stage, alive = plant.growth_stage, plant.alive
+            plant.update(current_time)
+            # Seeds appear at maturity and move when the plant dies
+            if plant.growth_stage != stage or plant.alive != alive:
+                self.refresh_plant(plant)
+            if alive and not plant.alive:
+                self.drop_seeds(plant)
+            self.scheduler.schedule(plant)
+            
+            # If plant is dead and has no seeds, remove it
+            if not plant.alive and not plant.seeds:
+                self.remove_plant(plant)
+    
+    def update_store(self):
+        """Advance every plant in the array store with vectorized operations"""
+        self.catch_up(())
+        for plant in self.store.step(self.clock.now):
+            self.refresh_plant(plant)
+            # Growing plants are still alive, so these just died
+            if not plant.alive:
+                self.drop_seeds(plant)
+                # If plant is dead and has no seeds, remove it
+                if not plant.seeds:
+                    self.remove_plant(plant)
     
     def draw(self, surface, mouse_pos=None):
         """Draw the garden, plants, and weather effects"""
         # Draw sky (already done in main)
+        self.draw_sun(surface)
+        
+        # Only the part of the world inside the area being redrawn is drawn
+        clip = surface.get_clip().clip(self.rect)
+        left = clip.left + self.camera_x
+        right = clip.right + self.camera_x
+        
+        self.draw_soil(surface, left, right)
         
-        # Draw sun effect
+        # Draw plants whose sprite reaches into the area
+        plants = self.plant_index.query_range(left - SPRITE_SIZE[0] + SPRITE_ANCHOR[0], right + SPRITE_ANCHOR[0])
+        # Plants that just scrolled into view may not have caught up on water and sun yet
+        self.catch_up(plants)
+        for plant in plants:
+            plant.draw_plant(surface, self.camera_x, self.detail)
+        
+        # Seeds go on top of every plant
+        for seed, _, _ in self.seed_index.query_rect(left - SEED_MARGIN, clip.top - SEED_MARGIN,
+                                                      right + SEED_MARGIN, clip.bottom + SEED_MARGIN):
+            if not seed.falling:
+                seed.draw(surface, self.camera_x)
+        self.falling_seeds.draw(surface, self.camera_x, self.blend)
+        
+        self.draw_rain(surface)
+    
+    def soil_tile(self, index):
+        """Soil texture for the index-th SOIL_TILE_WIDTH wide strip of the world"""
+        tile = self.soil_tiles.get(index)
+        if tile is None:
+            tile = pygame.Surface((SOIL_TILE_WIDTH, 50))
+            tile.fill(self.soil_color)
+            # Each tile has its own random stream, so it looks the same whenever it is made
+            rng = random.Random(self.soil_seed * 100003 + index)
+            for _ in range(int(SOIL_TILE_WIDTH * SOIL_DETAILS)):
+                x = rng.randint(0, SOIL_TILE_WIDTH - 1)
+                y = rng.randint(0, 49)
+                pygame.draw.circle(tile, (101, 67, 33), (x, y), rng.randint(1, 3))
+            tile = to_display_format(tile)
+            self.soil_tiles[index] = tile
+        return tile
+    
+    def draw_soil(self, surface, left, right):
+        """Draw the soil tiles between world x positions left and right"""
+        top = self.soil_rect.top
+        for index in range(max(left, 0) // SOIL_TILE_WIDTH, (min(right, self.width) - 1) // SOIL_TILE_WIDTH + 1):
+            surface.blit(self.soil_tile(index), (index * SOIL_TILE_WIDTH - self.camera_x, top))
+    
+    def draw_sun(self, surface):
+        """Draw the sun effect"""
         if self.is_sunny:
             # Draw sun
-            sun_x = self.width - 100
+            sun_x = self.view_width - 100
             sun_y = 100
             pygame.draw.circle(surface, (255, 255, 0), (sun_x, sun_y), 40)
             pygame.draw.circle(surface, (255, 200, 0), (sun_x, sun_y), 30)
@@ -156,26 +506,14 @@ class Garden:
             for ray in self.sun_rays:
                 start_x = ray["sun_x"]
                 start_y = ray["sun_y"]
-                angle = ray["angle"]
+                direction_x, direction_y = ray["direction"]
                 length = ray["length"]
-                end_x = start_x + int(length * pygame.math.Vector2(1, 0).rotate(angle).x)
-                end_y = start_y + int(length * pygame.math.Vector2(1, 0).rotate(angle).y)
+                end_x = start_x + int(length * direction_x)
+                end_y = start_y + int(length * direction_y)
                 pygame.draw.line(surface, (255, 255, 0), (start_x, start_y), (end_x, end_y), 3)
-        
-        # Draw soil
-        surface.blit(self.soil_texture, self.soil_rect)
-        
-        # Draw plants
-        for plant in self.plants:
-            plant.draw(surface)
-        
-        # Draw rain effect
+            self.sparkles.draw(surface, blend=self.blend)
+    
+    def draw_rain(self, surface):
+        """Draw the rain effect"""
         if self.is_raining:
-            for drop in self.raindrops:
-                pygame.draw.line(
-                    surface, 
-                    (100, 150, 255), 
-                    (drop["x"], drop["y"]), 
-                    (drop["x"], drop["y"] + 10), 
-                    2
-                )
\ No newline at end of file
+            self.rain.draw(surface, blend=self.blend)
@@ -0,0 +1,160 @@
+"""Headless garden simulation that runs without opening a window"""
+import argparse
+import heapq
+import itertools
+import random
+import time
+from constants import GARDEN_HEIGHT, GARDEN_WIDTH, PLANT_TYPES
+from frame_clock import FrameClock
+from garden import Garden
+from parallel import ParallelSimulation
+from plant import Seed
+
+class HeadlessSimulation:
+    """Advance a Garden on a fixed simulated timestep as fast as the CPU allows"""
+    def __init__(self, width=GARDEN_WIDTH, height=GARDEN_HEIGHT, dt=1/60, use_store=False, seed=None):
+        self.clock = FrameClock(start=0.0)
+        self.garden = Garden(width, height, use_store=use_store, clock=self.clock, seed=seed)
+        self.garden.animate_effects = False  # Nobody is watching the weather
+        self.dt = dt
+        self.frames = 0
+        self.seeds_collected = {plant_type: 0 for plant_type in PLANT_TYPES}
+
+        # Scripted actions waiting to run, as a heap of (time, order, action, args)
+        self.actions = []
+        self.order = itertools.count()
+
+    @property
+    def time(self):
+        """Current simulated time in seconds"""
+        return self.clock.now
+
+    def schedule(self, at, action, *args):
+        """Run an action (plant, water, sun, cut, collect, collect_all) at simulated time at"""
+        if not hasattr(self, action):
+            raise ValueError(f"Unknown action: {action}")
+        heapq.heappush(self.actions, (at, next(self.order), action, args))
+
+    def plant(self, x, plant_type):
+        """Plant a seed of the given type at x"""
+        self.garden.plant_seed(Seed(plant_type), x, self.garden.height - 10)
+
+    def water(self):
+        """Press the water button"""
+        self.garden.water_plants()
+
+    def sun(self):
+        """Press the sun button"""
+        self.garden.provide_sunlight()
+
+    def cut(self, x):
+        """Use the scissors at x"""
+        self.garden.cut_flowers(x, self.garden.height - 10)
+
+    def collect(self, x, y):
+        """Click at (x, y) to pick up a seed; returns the seed or None"""
+        seed = self.garden.check_seed_click((x, y))
+        if seed is not None:
+            self.seeds_collected[seed.plant_type] += 1
+        return seed
+
+    def collect_all(self):
+        """Pick up every seed dropped by a dead plant"""
+        for plant in list(self.garden.plants):
+            if not plant.alive:
+                for seed in list(plant.seeds):
+                    self.collect(seed.x, seed.y)
+
+    def step(self):
+        """Run due actions, then advance the garden by one fixed timestep"""
+        self.clock.step(self.dt)
+        while self.actions and self.actions[0][0] <= self.clock.now:
+            _, _, action, args = heapq.heappop(self.actions)
+            getattr(self, action)(*args)
+        self.garden.update()
+        self.frames += 1
+
+    def run(self, duration):
+        """Simulate duration seconds and return the wall-clock seconds it took"""
+        start = time.perf_counter()
+        end = self.clock.now + duration
+        while self.clock.now < end:
+            self.step()
+        return time.perf_counter() - start
+
+    def summary(self):
+        """Return a dictionary describing the current state of the garden"""
+        plants = self.garden.plants
+        self.garden.catch_up(plants)
+        stages = [0] * 7
+        for plant in plants:
+            if plant.alive:
+                stages[plant.growth_stage] += 1
+        return {
+            "time": self.clock.now,
+            "frames": self.frames,
+            "plants": len(plants),
+            "alive": sum(stages),
+            "stages": stages,
+            "seeds_on_plants": sum(len(plant.seeds) for plant in plants),
+            "seeds_collected": dict(self.seeds_collected),
+        }
+
+def load_script(simulation, path):
+    """Schedule actions from a text file with one "time action [args...]" per line"""
+    with open(path) as script:
+        for line in script:
+            line = line.split("#")[0].strip()
+            if not line:
+                continue
+            at, action, *args = line.split()
+            # Plant types stay strings, everything else is a number
+            args = [arg if arg in PLANT_TYPES else float(arg) for arg in args]
+            simulation.schedule(float(at), action, *args)
+
+def schedule_care(simulation, plants, care_interval, duration, rng=random):
+    """Plant random seeds, then alternate water and sun and pick up dropped seeds, like an attentive player"""
+    for _ in range(plants):
+        simulation.schedule(0, "plant", rng.randint(50, GARDEN_WIDTH - 50), rng.choice(PLANT_TYPES))
+    if care_interval > 0:
+        at = care_interval
+        while at < duration:
+            simulation.schedule(at, "water")
+            simulation.schedule(at + care_interval / 2, "sun")
+            simulation.schedule(at, "collect_all")
+            at += care_interval
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the flower garden without a window")
+    parser.add_argument("--duration", type=float, default=3600, help="simulated seconds to run")
+    parser.add_argument("--dt", type=float, default=1/60, help="simulated seconds per step")
+    parser.add_argument("--plants", type=int, default=20, help="random seeds planted at the start")
+    parser.add_argument("--care-interval", type=float, default=5, help="seconds between water/sun presses (0 disables)")
+    parser.add_argument("--script", help="file of scripted actions to run instead of the default care routine")
+    parser.add_argument("--store", action="store_true", help="use the NumPy plant store")
+    parser.add_argument("--seed", type=int, help="random seed, for runs that can be repeated exactly")
+    parser.add_argument("--workers", type=int, help="split the garden across this many processes (see parallel.py)")
+    args = parser.parse_args()
+
+    if args.workers is not None:
+        simulation = ParallelSimulation(GARDEN_WIDTH, dt=args.dt, workers=args.workers, seed=args.seed)
+    else:
+        simulation = HeadlessSimulation(dt=args.dt, use_store=args.store, seed=args.seed)
+    try:
+        if args.script:
+            load_script(simulation, args.script)
+        else:
+            schedule_care(simulation, args.plants, args.care_interval, args.duration, random.Random(args.seed))
+
+        elapsed = simulation.run(args.duration)
+        summary = simulation.summary()
+    finally:
+        # Worker processes and shared memory are freed even if the run fails
+        if args.workers is not None:
+            simulation.close()
+    print(f"Simulated {summary['time']:.0f}s in {elapsed:.2f}s ({summary['time'] / max(elapsed, 1e-9):.0f}x real time)")
+    for key, value in summary.items():
+        print(f"{key}: {value}")
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,19 @@
+import os
 import pygame
 import sys
-import random
+import time
 from garden import Garden
 from tools import ToolBar
-from plant import Plant, Seed
+from plant import Plant, Seed, seed_atlas
+from constants import (USE_PLANT_STORE, DIRTY_RECT_RENDERING, DIRTY_RECT_GAP, PROFILE_FRAMES, PROFILE_OVERLAY, PROFILE_TRACE,
+                       GARDEN_SEED, SAVE_FILE, AUTOSAVE_INTERVAL, WORLD_WIDTH, SCROLL_SPEED, RECORD_FILE,
+                       ADAPTIVE_DETAIL, DETAIL_DRAW_BUDGET, DETAIL_RECOVER, DETAIL_HOLD_FRAMES, FRAME_RATE,
+                       SIM_TICK_RATE, SIM_MAX_TICKS)
+from detail import DetailController
+from frame_clock import FixedTimestep, FrameClock
+from profiler import FrameProfiler
+from replay import ActionRecorder, GardenActions
+from savefile import AutoSaver, load_garden
 
 # Initialize pygame
 pygame.init()
@@ -14,18 +24,31 @@ SCREEN_HEIGHT = 600
 GARDEN_HEIGHT = int(SCREEN_HEIGHT * 7/8)
 TOOLBAR_HEIGHT = SCREEN_HEIGHT - GARDEN_HEIGHT
 BG_COLOR = (135, 206, 235)  # Sky blue background
+WHEEL_SCROLL = 40  # Pixels the garden scrolls per mouse wheel step
 
 # Create the game window
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Flower Growing Game")
 
+# Pre-render seed sprites now that the display format is known
+seed_atlas.build()
+
 # Create game objects
-garden = Garden(SCREEN_WIDTH, GARDEN_HEIGHT)
+frame_clock = FrameClock()  # Simulation time, read once per frame by everything
+# With a tick rate the garden updates on fixed steps however often frames are drawn
+timestep = FixedTimestep(frame_clock, SIM_TICK_RATE, SIM_MAX_TICKS) if SIM_TICK_RATE else None
+garden = Garden(WORLD_WIDTH, GARDEN_HEIGHT, use_store=USE_PLANT_STORE, clock=frame_clock, view_width=SCREEN_WIDTH,
+                seed=GARDEN_SEED)
 toolbar = ToolBar(SCREEN_WIDTH, TOOLBAR_HEIGHT, 0, GARDEN_HEIGHT)
+garden.track_dirty = DIRTY_RECT_RENDERING
+profiler = FrameProfiler(PROFILE_FRAMES, overlay=PROFILE_OVERLAY, trace_path=PROFILE_TRACE)
 
 # Game variables
 clock = pygame.time.Clock()
-FPS = 60
+FPS = FRAME_RATE
+# Plants are drawn simpler while drawing does not fit in the frame
+detail_controller = (DetailController(1 / FPS, DETAIL_DRAW_BUDGET, DETAIL_RECOVER, DETAIL_HOLD_FRAMES)
+                     if ADAPTIVE_DETAIL else None)
 selected_seed = None
 selected_tool = None
 
@@ -34,23 +57,125 @@ toolbar.seed_counts["rose"] = 3
 toolbar.seed_counts["sunflower"] = 3
 toolbar.seed_counts["daisy"] = 3
 
+# Carry on with the garden from last time, if there is one
+if SAVE_FILE and os.path.exists(SAVE_FILE):
+    try:
+        load_garden(SAVE_FILE, garden, toolbar.seed_counts)
+    except ValueError as error:
+        # Keep the damaged file for a look and start a fresh garden instead of overwriting it
+        os.replace(SAVE_FILE, SAVE_FILE + ".bad")
+        print(f"Could not load the saved garden ({error}); moved it to {SAVE_FILE}.bad and started a new one")
+autosaver = AutoSaver(SAVE_FILE, garden, toolbar.seed_counts, AUTOSAVE_INTERVAL) if SAVE_FILE else None
+
+# Everything the player does goes through actions, so it can be recorded and replayed
+recorder = ActionRecorder(RECORD_FILE, garden, toolbar.seed_counts, TOOLBAR_HEIGHT) if RECORD_FILE else None
+actions = GardenActions(garden, toolbar, recorder)
+
 # Empty list for backwards compatibility
 collected_seeds = []  # This is no longer used actively
 
+def cursor_rect(mouse_pos):
+    """Screen area covered by the seed or scissors following the mouse, if any"""
+    if selected_seed is not None:
+        rect = pygame.Rect(0, 0, 24, 24)
+    elif selected_tool == "scissors":
+        rect = pygame.Rect(0, 0, 44, 44)
+    else:
+        return None
+    rect.center = mouse_pos
+    return rect
+
+def group_dirty_rects(rects):
+    """Merge changed areas that overlap or lie within DIRTY_RECT_GAP of each other"""
+    groups = []
+    for rect in rects:
+        rect = rect.copy()
+        # Keep absorbing nearby groups, since a grown group can reach ones it missed before
+        merged = True
+        while merged:
+            merged = False
+            reach = rect.inflate(DIRTY_RECT_GAP * 2, DIRTY_RECT_GAP * 2)
+            for index, group in enumerate(groups):
+                if reach.colliderect(group):
+                    rect.union_ip(groups.pop(index))
+                    merged = True
+                    break
+        groups.append(rect)
+    return groups
+
+def draw_scene(mouse_pos):
+    """Draw everything; only the area inside the screen's clip rect actually changes"""
+    screen.fill(BG_COLOR)
+    garden.draw(screen)  # Remove mouse_pos parameter since we're not using it anymore
+    profiler.lap("garden_draw")
+    toolbar.draw(screen, collected_seeds)
+    profiler.lap("toolbar_draw")
+    
+    # Draw selected seed following the mouse if there is one
+    if selected_seed is not None:
+        selected_seed.draw_at_position(screen, mouse_pos[0], mouse_pos[1])
+        
+    # Draw scissors following the mouse if selected
+    if selected_tool == "scissors":
+        # Draw a simple scissors icon at mouse position
+        scissors_color = (80, 80, 100)
+        line_length = 12
+        # Draw the X shape
+        pygame.draw.line(screen, scissors_color, 
+                       (mouse_pos[0] - line_length, mouse_pos[1] - line_length),
+                       (mouse_pos[0] + line_length, mouse_pos[1] + line_length), 4)
+        pygame.draw.line(screen, scissors_color, 
+                       (mouse_pos[0] + line_length, mouse_pos[1] - line_length),
+                       (mouse_pos[0] - line_length, mouse_pos[1] + line_length), 4)
+        # Draw handles
+        pygame.draw.circle(screen, scissors_color, 
+                         (mouse_pos[0] - line_length - 3, mouse_pos[1] - line_length - 3), 5)
+        pygame.draw.circle(screen, scissors_color, 
+                         (mouse_pos[0] + line_length + 3, mouse_pos[1] - line_length - 3), 5)
+    profiler.lap("cursor_draw")
+    
+    # Phase timings go on top of everything
+    profiler.draw_overlay(screen)
+    profiler.lap("overlay")
+
 # Main game loop
 def main():
     global selected_seed, selected_tool
     
+    last_cursor_rect = None  # Where the cursor-following seed or scissors was last drawn
     running = True
     while running:
+        profiler.begin_frame()
+        
+        # Sample the time once so everything this frame sees the same moment
+        if timestep is None:
+            frame_clock.tick()
+        
         # Handle events
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
             
+            # The window was uncovered, so everything has to be redrawn
+            if event.type == pygame.WINDOWEXPOSED:
+                garden.mark_dirty(garden.rect)
+                toolbar.dirty_rects.append(toolbar.rect)
+            
+            # F3 shows or hides the profiler overlay
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and profiler.enabled:
+                if profiler.overlay_rect is not None:
+                    garden.mark_dirty(profiler.overlay_rect)
+                profiler.overlay = not profiler.overlay
+                profiler.overlay_image = None
+            
+            # The mouse wheel scrolls the garden sideways
+            if event.type == pygame.MOUSEWHEEL:
+                garden.scroll((event.x - event.y) * WHEEL_SCROLL)
+            
             # Mouse events
             if event.type == pygame.MOUSEBUTTONDOWN:
                 mouse_pos = pygame.mouse.get_pos()
+                world_pos = garden.to_world(mouse_pos)
                 
                 # Left click
                 if event.button == 1:
@@ -59,19 +184,16 @@ def main():
                         # If scissors are selected
                         if selected_tool == "scissors":
                             # Cut flowers but don't collect seeds automatically
-                            garden.cut_flowers(mouse_pos[0], mouse_pos[1])
+                            actions.cut(world_pos[0], world_pos[1])
                             # Seeds will drop to the ground and player can collect them manually
                         # If we have a selected seed, plant it
                         elif selected_seed is not None:
-                            garden.plant_seed(selected_seed, mouse_pos[0], mouse_pos[1])
+                            actions.plant(selected_seed.plant_type, world_pos[0], world_pos[1])
                             selected_seed = None
                         else:
                             # Check if clicked near a seed from a plant
-                            seed = garden.check_seed_click(mouse_pos)
-                            if seed:
-                                # Add seed directly to toolbar storage
-                                toolbar.add_seed(seed.plant_type)
-                                # No need to select the seed as it goes directly to storage
+                            # A seed that was clicked goes directly to toolbar storage
+                            actions.collect(world_pos[0], world_pos[1])
                 
                 # Right click - auto plant feature
                 elif event.button == 3:
@@ -82,19 +204,9 @@ def main():
                             # Get the seed type
                             seed_type = tool_clicked.split("_")[1]
                             
-                            # Check if we have seeds of this type
+                            # Plant a stored seed, if we have one, at a random spot in the soil on screen
                             if toolbar.seed_counts[seed_type] > 0:
-                                # Remove a seed from storage
-                                toolbar.remove_seed(seed_type)
-                                
-                                # Create the seed 
-                                auto_seed = Seed(seed_type)
-                                
-                                # Pick a random horizontal position in soil
-                                random_x = random.randint(50, SCREEN_WIDTH - 50)
-                                
-                                # Plant the seed
-                                garden.plant_seed(auto_seed, random_x, GARDEN_HEIGHT - 10)
+                                actions.auto_plant(seed_type)
                 
                 # Regular left click handling for toolbar
                 if event.button == 1 and mouse_pos[1] >= GARDEN_HEIGHT:
@@ -103,17 +215,17 @@ def main():
                         # Clicked in toolbar area but not on any tool
                         if selected_seed:
                             # Store seed based on its type
-                            toolbar.add_seed(selected_seed.plant_type)
+                            actions.store_seed(selected_seed.plant_type)
                             selected_seed = None
                         # Deselect scissors if they were selected
                         if selected_tool == "scissors":
                             selected_tool = None
                     elif tool_clicked == "water":
-                        garden.water_plants()
+                        actions.water()
                         # Deselect any tools
                         selected_tool = None
                     elif tool_clicked == "sun":
-                        garden.provide_sunlight()
+                        actions.sun()
                         # Deselect any tools
                         selected_tool = None
                     elif tool_clicked == "scissors":
@@ -121,7 +233,7 @@ def main():
                         selected_tool = "scissors"
                         # Deselect seed if one was selected
                         if selected_seed:
-                            toolbar.add_seed(selected_seed.plant_type)
+                            actions.store_seed(selected_seed.plant_type)
                             selected_seed = None
                     elif tool_clicked.startswith("seed_"):
                         # Deselect any tools first
@@ -132,55 +244,75 @@ def main():
                         
                         if selected_seed is None:
                             # No seed selected, try to take one from storage
-                            if toolbar.remove_seed(seed_type):
+                            if actions.take_seed(seed_type):
                                 selected_seed = Seed(seed_type)
                         else:
                             # Already have a seed selected, put it in storage
-                            toolbar.add_seed(selected_seed.plant_type)
+                            actions.store_seed(selected_seed.plant_type)
                             selected_seed = None
         
+        # Arrow keys (or A and D) scroll the garden while held
+        keys = pygame.key.get_pressed()
+        direction = (keys[pygame.K_RIGHT] or keys[pygame.K_d]) - (keys[pygame.K_LEFT] or keys[pygame.K_a])
+        if direction:
+            garden.scroll(direction * SCROLL_SPEED * clock.get_time() / 1000)
+        profiler.lap("events")
+        
         # Update
-        garden.update()
+        if timestep is None:
+            garden.update()
+        else:
+            # As many fixed steps as real time allows; moving effects are drawn between the last two
+            for _ in range(timestep.advance()):
+                timestep.step()
+                garden.update()
+            garden.interpolate(timestep.fraction)
+        if autosaver is not None:
+            autosaver.update()
+        profiler.lap("update")
         
         # Get mouse position for highlighting seeds
         mouse_pos = pygame.mouse.get_pos()
+        overlay_rect = profiler.update_overlay()
+        draw_start = time.perf_counter()
         
-        # Draw everything
-        screen.fill(BG_COLOR)
-        garden.draw(screen)  # Remove mouse_pos parameter since we're not using it anymore
-        toolbar.draw(screen, collected_seeds)
-        
-        # Draw selected seed following the mouse if there is one
-        if selected_seed is not None:
-            mouse_pos = pygame.mouse.get_pos()
-            selected_seed.draw_at_position(screen, mouse_pos[0], mouse_pos[1])
+        if DIRTY_RECT_RENDERING:
+            # Only redraw and push the areas that changed this frame
+            rects = garden.take_dirty_rects() + toolbar.take_dirty_rects()
+            if overlay_rect is not None:
+                rects.append(overlay_rect)
+            current_cursor_rect = cursor_rect(mouse_pos)
+            if current_cursor_rect != last_cursor_rect:
+                rects += [rect for rect in (last_cursor_rect, current_cursor_rect) if rect is not None]
+                last_cursor_rect = current_cursor_rect
+            if rects:
+                # Far apart areas are redrawn separately, so the space between them is left alone
+                for group in group_dirty_rects(rects):
+                    screen.set_clip(group)
+                    draw_scene(mouse_pos)
+                screen.set_clip(None)
+                pygame.display.update(rects)
+        else:
+            # Draw everything
+            draw_scene(mouse_pos)
             
-        # Draw scissors following the mouse if selected
-        if selected_tool == "scissors":
-            mouse_pos = pygame.mouse.get_pos()
-            # Draw a simple scissors icon at mouse position
-            scissors_color = (80, 80, 100)
-            line_length = 12
-            # Draw the X shape
-            pygame.draw.line(screen, scissors_color, 
-                           (mouse_pos[0] - line_length, mouse_pos[1] - line_length),
-                           (mouse_pos[0] + line_length, mouse_pos[1] + line_length), 4)
-            pygame.draw.line(screen, scissors_color, 
-                           (mouse_pos[0] + line_length, mouse_pos[1] - line_length),
-                           (mouse_pos[0] - line_length, mouse_pos[1] + line_length), 4)
-            # Draw handles
-            pygame.draw.circle(screen, scissors_color, 
-                             (mouse_pos[0] - line_length - 3, mouse_pos[1] - line_length - 3), 5)
-            pygame.draw.circle(screen, scissors_color, 
-                             (mouse_pos[0] + line_length + 3, mouse_pos[1] - line_length - 3), 5)
-        
-        # Update the display
-        pygame.display.flip()
+            # Update the display
+            pygame.display.flip()
+        if detail_controller is not None:
+            garden.set_detail(detail_controller.update(time.perf_counter() - draw_start))
+        profiler.lap("flip")
         
         # Cap the frame rate
         clock.tick(FPS)
+        profiler.lap("wait")
+        profiler.end_frame()
     
-    # Quit pygame
+    # Save the garden and quit pygame
+    if autosaver is not None:
+        autosaver.close()
+    if recorder is not None:
+        recorder.close(frame_clock.now)
+    profiler.close()
     pygame.quit()
     sys.exit()
 
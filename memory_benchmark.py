@@ -0,0 +1,101 @@
+"""Measure how much memory plants and seeds take
+
+Objects are created with tracemalloc running, so the numbers count every
+Python allocation they make (instance, attribute storage, colour tuples,
+rects), but not memory shared with objects created earlier.
+
+Plants and seeds are also measured in the layout they had before __slots__
+and shared species, as a reference: every attribute and colour in a
+per-instance __dict__, plus the leaf vein colour and rect each one built.
+"""
+import argparse
+import json
+import random
+import tracemalloc
+import pygame
+from constants import PLANT_TYPES
+from frame_clock import FrameClock
+from garden import Garden
+from plant import BasePlant, Plant, Seed, species_of
+
+class DictPlant:
+    """Reference: a plant's attributes and colours in a per-instance __dict__"""
+    def __init__(self, plant):
+        for name in BasePlant.__slots__ + Plant.__slots__:
+            setattr(self, name, getattr(plant, name))
+        species = species_of(plant.plant_type)
+        self.stem_color = species.stem_color
+        self.leaf_color = species.leaf_color
+        self.flower_color = species.flower_color
+        self.flower_highlight = species.flower_highlight
+        self.center_color = species.center_color
+        self.leaf_vein_color = tuple(max(0, channel - 30) for channel in self.leaf_color)
+
+class DictSeed:
+    """Reference: a seed's attributes, colours and rect in a per-instance __dict__"""
+    def __init__(self, seed):
+        for name in Seed.__slots__:
+            setattr(self, name, getattr(seed, name))
+        species = species_of(seed.plant_type)
+        self.size = Seed.size
+        self.rect = pygame.Rect(seed.x - self.size/2, seed.y - self.size/2, self.size, self.size)
+        self.color = species.seed_color
+        self.highlight_color = species.seed_highlight
+        self.shape = species.seed_shape
+
+def allocated(build):
+    """Bytes still allocated after build() runs, and its result"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+def measure(count):
+    """Bytes per plant, per seed and per fully grown plant in a garden, for count of each
+
+    The dict_ numbers are the same plants and seeds in the reference layout.
+    """
+    def make_plants(rng):
+        return [Plant(rng.choice(PLANT_TYPES), rng.randint(0, 4000), 475, 0.0) for _ in range(count)]
+
+    def make_seeds(rng):
+        return [Seed(rng.choice(PLANT_TYPES), rng.randint(0, 4000), 460, rng) for _ in range(count)]
+
+    plant_bytes, plants = allocated(lambda: make_plants(random.Random(0)))
+    seed_bytes, seeds = allocated(lambda: make_seeds(random.Random(1)))
+    # The same objects again, copied into the reference layout; only the copies stay alive
+    dict_plant_bytes, dict_plants = allocated(lambda: [DictPlant(plant) for plant in make_plants(random.Random(0))])
+    dict_seed_bytes, dict_seeds = allocated(lambda: [DictSeed(seed) for seed in make_seeds(random.Random(1))])
+    rng = random.Random(2)
+
+    def build_garden():
+        garden = Garden(4000, 525, clock=FrameClock(start=0.0), seed=0)
+        for _ in range(count):
+            plant = garden.create_plant(rng.choice(PLANT_TYPES), rng.randint(0, 4000), 475)
+            for _ in range(6):
+                plant.grow()
+            garden.add_plant(plant)
+        return garden
+    garden_bytes, garden = allocated(build_garden)
+
+    return {
+        "count": count,
+        "bytes_per_plant": round(plant_bytes / count, 1),
+        "bytes_per_dict_plant": round(dict_plant_bytes / count, 1),
+        "bytes_per_seed": round(seed_bytes / count, 1),
+        "bytes_per_dict_seed": round(dict_seed_bytes / count, 1),
+        "bytes_per_garden_plant": round(garden_bytes / count, 1),
+        "seeds_per_garden_plant": round(sum(len(plant.seeds) for plant in garden.plants) / count, 2),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure memory used per plant and per seed")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+    pygame.init()
+    print(json.dumps([measure(count) for count in args.counts], indent=2))
+
+if __name__ == "__main__":
+    main()
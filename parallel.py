@@ -0,0 +1,383 @@
+"""Headless simulation of very large gardens split across worker processes
+
+The garden is cut into vertical strips ("chunks") by x. Each chunk keeps its
+plants as NumPy columns in shared memory, so any worker in the pool can
+advance any chunk in place and only small results travel between processes.
+Plants are plain rows here rather than Plant objects, and seeds are counted
+per plant instead of being placed on the ground.
+"""
+import argparse
+import heapq
+import itertools
+import math
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+import numpy as np
+from constants import GARDEN_WIDTH, PLANT_TYPES
+from frame_clock import FrameClock
+from garden import CUT_RADIUS
+from plant import Plant
+from plant_store import PlantStore
+
+# Simulation columns of a PlantStore plus what a Plant object would otherwise hold
+COLUMNS = dict(PlantStore.COLUMNS, x=np.float64, plant_type=np.int8, seeds=np.int8)
+
+class Chunk:
+    """One strip of the garden: its shared-memory columns and how many rows are in use"""
+    def __init__(self, index, capacity=1024):
+        self.index = index
+        self.count = 0
+        self.capacity = 0
+        self.blocks = {}  # column name -> SharedMemory
+        self.columns = {}  # column name -> array over its block
+        self.next_event = math.inf  # Earliest time a plant in the chunk grows or dies on its own
+        self.resize(capacity)
+
+    def resize(self, capacity):
+        """Move the columns into new shared memory blocks with room for capacity rows"""
+        old_blocks = self.blocks
+        self.blocks = {}
+        columns = {}
+        for name, dtype in COLUMNS.items():
+            block = shared_memory.SharedMemory(create=True, size=max(1, capacity * np.dtype(dtype).itemsize))
+            column = np.ndarray(capacity, dtype=dtype, buffer=block.buf)
+            if name in self.columns:
+                column[:self.count] = self.columns[name][:self.count]
+            self.blocks[name] = block
+            columns[name] = column
+        self.columns = columns
+        self.capacity = capacity
+        for block in old_blocks.values():
+            block.close()
+            block.unlink()
+
+    def spec(self):
+        """What a worker needs to find this chunk's columns"""
+        return (self.index, self.capacity, self.count, {name: block.name for name, block in self.blocks.items()})
+
+    def add(self, xs, plant_types, current_time, growth_time, lifetimes):
+        """Append new plants (stage 0) given as arrays"""
+        n = len(xs)
+        if self.count + n > self.capacity:
+            self.resize(max(self.capacity * 2, self.count + n))
+        new = slice(self.count, self.count + n)
+        columns = self.columns
+        for name in COLUMNS:
+            columns[name][new] = 0
+        columns["x"][new] = xs
+        columns["plant_type"][new] = plant_types
+        columns["growth_timer"][new] = current_time
+        columns["growth_speed"][new] = growth_time
+        columns["lifetime"][new] = lifetimes
+        columns["alive"][new] = True
+        self.count += n
+        self.next_event = min(self.next_event, current_time + growth_time)
+
+    def view(self, name):
+        """Rows in use of one column"""
+        return self.columns[name][:self.count]
+
+    def close(self):
+        """Release the shared memory"""
+        self.columns = {}
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = {}
+
+# Worker side: blocks attached so far, by chunk index
+_attached = {}
+
+def _attach(spec):
+    """Columns of a chunk in this process, attaching to its blocks the first time"""
+    index, capacity, count, names = spec
+    attached = _attached.get(index)
+    if attached is None or attached[0] != names:
+        if attached is not None:
+            for block in attached[1]:
+                block.close()
+        blocks = []
+        columns = {}
+        for name, block_name in names.items():
+            block = shared_memory.SharedMemory(name=block_name)
+            blocks.append(block)
+            columns[name] = np.ndarray(capacity, dtype=COLUMNS[name], buffer=block.buf)
+        attached = (names, blocks, columns)
+        _attached[index] = attached
+    return attached[2]
+
+def _step(columns, n, current_time, seed_yield, rng):
+    """Natural growth, maturity and death, with the same rules as PlantStore.step"""
+    stage = columns["growth_stage"][:n]
+    alive = columns["alive"][:n]
+    growing = alive & (current_time - columns["growth_timer"][:n] > columns["growth_speed"][:n]) & (stage < 6)
+    stage[growing] += 1
+    columns["growth_timer"][:n][growing] = current_time
+
+    matured = growing & (stage == 6)
+    columns["maturity_time"][:n][matured] = current_time
+    columns["seeds"][:n][matured] = rng.integers(seed_yield[0], seed_yield[1] + 1, np.count_nonzero(matured))
+
+    maturity_time = columns["maturity_time"][:n]
+    dying = alive & (stage == 6) & (maturity_time > 0) & (current_time - maturity_time > columns["lifetime"][:n])
+    alive[dying] = False
+
+def _boost(columns, n, level, seed_yield, rng):
+    """One more water or sun level, with the same rules as PlantStore.boost"""
+    columns[level][:n] += 1
+    boosted = (columns["water_level"][:n] >= 1) & (columns["sun_level"][:n] >= 1)
+    stage = columns["growth_stage"][:n]
+    growing = boosted & (stage < 6)
+    stage[growing] += 1
+    columns["water_level"][:n][boosted] = 0
+    columns["sun_level"][:n][boosted] = 0
+    matured = growing & (stage == 6)
+    columns["seeds"][:n][matured] = rng.integers(seed_yield[0], seed_yield[1] + 1, np.count_nonzero(matured))
+
+def _cut(columns, n, x):
+    """Kill flowering plants within CUT_RADIUS of x, like Garden.cut_flowers"""
+    cut = ((np.abs(columns["x"][:n] - x) <= CUT_RADIUS) & (columns["growth_stage"][:n] >= 5)
+           & columns["alive"][:n])
+    columns["alive"][:n][cut] = False
+
+def _collect_all(columns, n):
+    """Pick up the seeds of every dead plant; returns seeds collected per plant type"""
+    dead = ~columns["alive"][:n]
+    collected = np.bincount(columns["plant_type"][:n][dead], weights=columns["seeds"][:n][dead],
+                            minlength=len(PLANT_TYPES))
+    columns["seeds"][:n][dead] = 0
+    return collected.astype(int).tolist()
+
+def _compact(columns, n):
+    """Drop dead plants without seeds, keeping the order of the rest; returns the new count"""
+    keep = columns["alive"][:n] | (columns["seeds"][:n] > 0)
+    if keep.all():
+        return n
+    rows = np.flatnonzero(keep)
+    for column in columns.values():
+        column[:rows.size] = column[rows]
+    return rows.size
+
+def _next_event(columns, n):
+    """Earliest time a plant in the chunk grows or dies on its own"""
+    alive = columns["alive"][:n]
+    stage = columns["growth_stage"][:n]
+    growing = alive & (stage < 6)
+    maturity_time = columns["maturity_time"][:n]
+    # Plants matured by a boost have no maturity time and never die on their own
+    dying = alive & (stage == 6) & (maturity_time > 0)
+    deadlines = np.concatenate([(columns["growth_timer"][:n] + columns["growth_speed"][:n])[growing],
+                                (maturity_time + columns["lifetime"][:n])[dying]])
+    return float(deadlines.min()) if deadlines.size else math.inf
+
+def run_chunk(task):
+    """Worker: run one command on one chunk; returns (new count, next event time, result)"""
+    spec, command, args, entropy = task
+    return run_command(_attach(spec), spec[2], command, args, entropy)
+
+def run_command(columns, n, command, args, entropy):
+    """Run one command on the first n rows of a chunk's columns"""
+    rng = np.random.default_rng(entropy)
+    result = None
+    if command == "step":
+        _step(columns, n, args[0], args[1], rng)
+    elif command == "boost":
+        _boost(columns, n, args[0], args[1], rng)
+    elif command == "cut":
+        _cut(columns, n, args[0])
+    elif command == "collect_all":
+        result = _collect_all(columns, n)
+    else:
+        raise ValueError(f"Unknown chunk command: {command}")
+    n = _compact(columns, n)
+    return n, _next_event(columns, n), result
+
+class ParallelSimulation:
+    """Headless garden split into chunks that a process pool advances in parallel
+
+    Offers the actions of HeadlessSimulation except picking up single seeds.
+    With workers=0 the chunks are run in this process, which gives the same
+    results and is handy for comparing.
+    """
+    def __init__(self, width=GARDEN_WIDTH, dt=1/60, workers=None, chunks=None, seed=0):
+        if workers is None:
+            workers = multiprocessing.cpu_count()
+        self.width = width
+        self.dt = dt
+        self.clock = FrameClock(start=0.0)
+        self.frames = 0
+        self.chunks = [Chunk(index) for index in range(chunks or max(workers, 1))]
+        self.pool = multiprocessing.Pool(workers) if workers > 0 else None
+        # Without a seed one is drawn now, so chunk random streams can still be derived from it
+        self.seed = np.random.SeedSequence().entropy if seed is None else seed
+        self.tasks = itertools.count()  # Gives every chunk task its own random stream
+        self.rng = np.random.default_rng(self.seed)
+        self.last_action = None  # Water and sun only count when they alternate, like Garden
+        self.seeds_collected = {plant_type: 0 for plant_type in PLANT_TYPES}
+
+        # Scripted actions waiting to run, as a heap of (time, order, action, args)
+        self.actions = []
+        self.order = itertools.count()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop the workers and free the shared memory"""
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+        for chunk in self.chunks:
+            chunk.close()
+
+    @property
+    def time(self):
+        """Current simulated time in seconds"""
+        return self.clock.now
+
+    def run_chunks(self, chunks, command, *args):
+        """Run a command on the chunks in parallel and return their results"""
+        entropy = [(self.seed, chunk.index, next(self.tasks)) for chunk in chunks]
+        if self.pool is not None and len(chunks) > 1:
+            results = self.pool.map(run_chunk, [(chunk.spec(), command, args, chunk_entropy)
+                                                for chunk, chunk_entropy in zip(chunks, entropy)])
+        else:
+            # Not worth a round trip to the pool
+            results = [run_command(chunk.columns, chunk.count, command, args, chunk_entropy)
+                       for chunk, chunk_entropy in zip(chunks, entropy)]
+        outputs = []
+        for chunk, (count, next_event, output) in zip(chunks, results):
+            chunk.count = count
+            chunk.next_event = next_event
+            outputs.append(output)
+        return outputs
+
+    def chunk_index(self, x):
+        """Index of the chunk holding plants at x"""
+        return min(max(int(x * len(self.chunks) // self.width), 0), len(self.chunks) - 1)
+
+    def schedule(self, at, action, *args):
+        """Run an action (plant, water, sun, cut, collect_all) at simulated time at"""
+        if not hasattr(self, action):
+            raise ValueError(f"Unknown action: {action}")
+        heapq.heappush(self.actions, (at, next(self.order), action, args))
+
+    def plant(self, x, plant_type):
+        """Plant a seed of the given type at x"""
+        self.plant_many(np.array([x]), np.array([PLANT_TYPES.index(plant_type)]))
+
+    def plant_many(self, xs, plant_types):
+        """Plant seeds at the x positions in xs, with types given as indexes into PLANT_TYPES"""
+        xs = np.asarray(xs, dtype=np.float64)
+        plant_types = np.asarray(plant_types)
+        low, high = Plant.lifetime_range
+        lifetimes = self.rng.integers(low, high + 1, len(xs))
+        chunk_indexes = np.clip((xs * len(self.chunks) // self.width).astype(int), 0, len(self.chunks) - 1)
+        for chunk in self.chunks:
+            mine = chunk_indexes == chunk.index
+            if mine.any():
+                chunk.add(xs[mine], plant_types[mine], self.clock.now, Plant.growth_time, lifetimes[mine])
+
+    def water(self):
+        """Press the water button"""
+        if self.last_action != "water":
+            self.run_chunks(self.chunks, "boost", "water_level", Plant.seed_yield)
+            self.last_action = "water"
+
+    def sun(self):
+        """Press the sun button"""
+        if self.last_action != "sun":
+            self.run_chunks(self.chunks, "boost", "sun_level", Plant.seed_yield)
+            self.last_action = "sun"
+
+    def cut(self, x):
+        """Use the scissors at x"""
+        first = self.chunk_index(x - CUT_RADIUS)
+        last = self.chunk_index(x + CUT_RADIUS)
+        self.run_chunks(self.chunks[first:last + 1], "cut", x)
+
+    def collect_all(self):
+        """Pick up every seed dropped by a dead plant"""
+        for collected in self.run_chunks(self.chunks, "collect_all"):
+            for plant_type, count in zip(PLANT_TYPES, collected):
+                self.seeds_collected[plant_type] += count
+
+    def step(self):
+        """Run due actions, then advance every chunk that has an event due"""
+        self.clock.step(self.dt)
+        now = self.clock.now
+        while self.actions and self.actions[0][0] <= now:
+            _, _, action, args = heapq.heappop(self.actions)
+            getattr(self, action)(*args)
+        # Plants change strictly after their deadline, like Plant.update
+        due = [chunk for chunk in self.chunks if chunk.next_event < now]
+        if due:
+            self.run_chunks(due, "step", now, Plant.seed_yield)
+        self.frames += 1
+
+    def run(self, duration):
+        """Simulate duration seconds and return the wall-clock seconds it took"""
+        start = time.perf_counter()
+        end = self.clock.now + duration
+        while self.clock.now < end:
+            self.step()
+        return time.perf_counter() - start
+
+    def summary(self):
+        """Return a dictionary describing the current state of the garden, like HeadlessSimulation"""
+        stages = np.zeros(7, dtype=int)
+        plants = 0
+        seeds = 0
+        for chunk in self.chunks:
+            alive = chunk.view("alive")
+            stages += np.bincount(chunk.view("growth_stage")[alive], minlength=7)
+            plants += chunk.count
+            seeds += int(chunk.view("seeds").sum())
+        return {
+            "time": self.clock.now,
+            "frames": self.frames,
+            "plants": plants,
+            "alive": int(stages.sum()),
+            "stages": stages.tolist(),
+            "seeds_on_plants": seeds,
+            "seeds_collected": dict(self.seeds_collected),
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a very large garden on several cores")
+    parser.add_argument("--duration", type=float, default=600, help="simulated seconds to run")
+    parser.add_argument("--dt", type=float, default=1/60, help="simulated seconds per step")
+    parser.add_argument("--plants", type=int, default=1_000_000, help="random seeds planted at the start")
+    parser.add_argument("--width", type=int, default=1_000_000, help="garden width in pixels")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="worker processes (0 runs in this process)")
+    parser.add_argument("--chunks", type=int, help="strips the garden is cut into (default: one per worker)")
+    parser.add_argument("--care-interval", type=float, default=5, help="seconds between water/sun presses (0 disables)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    args = parser.parse_args()
+
+    with ParallelSimulation(args.width, args.dt, args.workers, args.chunks, args.seed) as simulation:
+        rng = np.random.default_rng(args.seed)
+        simulation.plant_many(rng.integers(0, args.width, args.plants), rng.integers(0, len(PLANT_TYPES), args.plants))
+        # Alternate water and sun, and pick up dropped seeds, like an attentive player
+        if args.care_interval > 0:
+            at = args.care_interval
+            while at < args.duration:
+                simulation.schedule(at, "water")
+                simulation.schedule(at + args.care_interval / 2, "sun")
+                simulation.schedule(at, "collect_all")
+                at += args.care_interval
+
+        elapsed = simulation.run(args.duration)
+        summary = simulation.summary()
+    print(f"Simulated {summary['time']:.0f}s of {args.plants} plants in {elapsed:.2f}s "
+          f"({summary['time'] / max(elapsed, 1e-9):.0f}x real time)")
+    for key, value in summary.items():
+        print(f"{key}: {value}")
+
+if __name__ == "__main__":
+    main()
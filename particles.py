@@ -0,0 +1,134 @@
+import numpy as np
+import pygame
+from sprites import to_display_format
+
+class ParticleSystem:
+    """Pool of sprite particles moved with vectorized NumPy operations
+
+    Positions and velocities are in pixels and pixels per second. Particles
+    live until their lifetime runs out; with wrap=True, particles falling
+    below bounds start again just above it at a random x, like rain.
+
+    Positions before the last update are kept too, so particles can be drawn
+    part of the way between two updates when updates are less frequent than
+    frames.
+    """
+    def __init__(self, sprites=(), capacity=64, gravity=0.0, bounds=None, wrap=False, rng=None):
+        self.sprites = []  # Surfaces; particles refer to them by index
+        self.offsets = []  # Blit offset that centers each sprite on its particle
+        for sprite in sprites:
+            self.add_sprite(sprite)
+        self.gravity = gravity
+        self.bounds = bounds
+        self.wrap = wrap
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+        self.count = 0
+        self.position = np.zeros((capacity, 2))
+        self.previous = np.zeros((capacity, 2))  # Positions before the last update
+        self.velocity = np.zeros((capacity, 2))
+        self.age = np.zeros(capacity)
+        self.lifetime = np.zeros(capacity)
+        self.sprite = np.zeros(capacity, dtype=np.int32)
+
+    def __len__(self):
+        return self.count
+
+    def add_sprite(self, sprite):
+        """Register a sprite and return the index particles use to refer to it"""
+        self.sprites.append(sprite)
+        self.offsets.append((sprite.get_width() // 2, sprite.get_height() // 2))
+        return len(self.sprites) - 1
+
+    def reserve(self, capacity):
+        """Make sure there is room for at least capacity particles"""
+        if capacity <= len(self.age):
+            return
+        capacity = max(capacity, len(self.age) * 2)
+        for name in ("position", "previous", "velocity", "age", "lifetime", "sprite"):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def emit(self, x, y, vx=0.0, vy=0.0, lifetime=np.inf, sprite=0):
+        """Add particles; every argument may be a scalar or an array of the same length"""
+        x, y, vx, vy, lifetime, sprite = np.broadcast_arrays(x, y, vx, vy, lifetime, sprite)
+        n = x.size
+        if n == 0:
+            return
+        self.reserve(self.count + n)
+        new = slice(self.count, self.count + n)
+        self.position[new, 0] = x.ravel()
+        self.position[new, 1] = y.ravel()
+        self.previous[new] = self.position[new]
+        self.velocity[new, 0] = vx.ravel()
+        self.velocity[new, 1] = vy.ravel()
+        self.age[new] = 0.0
+        self.lifetime[new] = lifetime.ravel()
+        self.sprite[new] = sprite.ravel()
+        self.count += n
+
+    def clear(self):
+        """Remove every particle"""
+        self.count = 0
+
+    def update(self, dt):
+        """Move every particle by one time step and drop the expired ones"""
+        n = self.count
+        if n == 0 or dt == 0:
+            return
+        position = self.position[:n]
+        velocity = self.velocity[:n]
+        self.previous[:n] = position
+        velocity[:, 1] += self.gravity * dt
+        position += velocity * dt
+        self.age[:n] += dt
+
+        if self.wrap and self.bounds is not None:
+            # Particles that fell out of the bottom start again above the top
+            fallen = np.flatnonzero(position[:, 1] > self.bounds.bottom)
+            if fallen.size:
+                position[fallen, 0] = self.rng.uniform(self.bounds.left, self.bounds.right, fallen.size)
+                position[fallen, 1] = self.bounds.top - self.rng.uniform(0, 50, fallen.size)
+                # Drawn at the top straight away, not sliding back up the screen
+                self.previous[fallen] = position[fallen]
+
+        # Compact the arrays so live particles stay at the front
+        alive = self.age[:n] < self.lifetime[:n]
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            for column in (self.position, self.previous, self.velocity, self.age, self.lifetime, self.sprite):
+                column[:keep.size] = column[keep]
+            self.count = keep.size
+
+    def draw(self, surface, offset_x=0, blend=1.0):
+        """Blit every particle in one batched call, shifted left by offset_x
+
+        blend is how far particles are drawn from where they were before the
+        last update (0) to where they are now (1).
+        """
+        n = self.count
+        if n == 0:
+            return
+        position = self.position[:n]
+        if blend < 1.0:
+            previous = self.previous[:n]
+            position = previous + (position - previous) * blend
+        xs = (position[:, 0] - offset_x).astype(np.int32).tolist()
+        ys = position[:, 1].astype(np.int32).tolist()
+        if len(self.sprites) == 1:
+            sprite = self.sprites[0]
+            sprite_dx, sprite_dy = self.offsets[0]
+            surface.blits([(sprite, (x - sprite_dx, y - sprite_dy)) for x, y in zip(xs, ys)], False)
+        else:
+            sprites = self.sprites
+            offsets = self.offsets
+            surface.blits([(sprites[i], (x - offsets[i][0], y - offsets[i][1]))
+                           for i, x, y in zip(self.sprite[:n].tolist(), xs, ys)], False)
+
+def make_sprite(size, draw):
+    """Create a transparent sprite and let draw(sprite) paint it"""
+    sprite = pygame.Surface(size, pygame.SRCALPHA)
+    draw(sprite)
+    return to_display_format(sprite)
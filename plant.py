@@ -1,58 +1,253 @@
+import math
 import pygame
 import random
 import time
+from collections import namedtuple
+from constants import (PLANT_TYPES, SPRITE_CACHE_SIZE, LEAN_QUANTUM, SEED_ROTATION_BUCKETS, STEM_SEGMENTS,
+                       MIN_STEM_SEGMENTS, NATURAL_GROWTH_TIME, PLANT_LIFETIME, SEED_YIELD)
+from sprites import SpriteCache, SeedAtlas
+
+# Plant sprites are drawn with the base of the stem at SPRITE_ANCHOR; the size
+# leaves room for the tallest stem (150px) plus the widest flower and leaves
+SPRITE_SIZE = (96, 192)
+SPRITE_ANCHOR = (48, 186)
+SPRITE_COLORKEY = (255, 0, 255)  # Transparent colour of simplified sprites; no plant uses it
+MAX_STEM_HEIGHT = 150
+
+# Shared cache of pre-rendered plant sprites
+sprite_cache = SpriteCache(SPRITE_CACHE_SIZE)
+
+# Seeds are 12px across; the sprite has a little spare room for the outline
+SEED_SPRITE_SIZE = 16
+SEED_SPREAD = 30  # Furthest a seed grows from the stem, horizontally
+
+# Flower geometry uses a fixed set of angles, so every petal, sepal and highlight
+# is precomputed once as offsets from the top of the stem and only translated per plant
+FLOWER_RADIUS = 20
+
+# Levels of detail plants can be drawn at, from most to least detailed
+DETAIL_FULL = 0  # Petals, highlights and textured centers
+DETAIL_SIMPLE = 1  # Plain leaves, and the flower as a disc with its center
+DETAIL_BLOB = 2  # A straight stem and one coloured blob
+DETAIL_LEVELS = (DETAIL_FULL, DETAIL_SIMPLE, DETAIL_BLOB)
+# (flower, center) radius of the simplified flower disc, as a share of FLOWER_RADIUS
+SIMPLE_FLOWER_RADII = {"rose": (0.85, 0.2), "sunflower": (1.3, 0.5), "daisy": (1.1, 0.4)}
+
+def unit_vectors(count, offset=0.0):
+    """Unit vectors for count evenly spaced angles in degrees, starting at offset"""
+    vectors = []
+    for i in range(count):
+        direction = pygame.math.Vector2(1, 0).rotate(offset + i * (360 / count))
+        vectors.append((direction.x, direction.y))
+    return vectors
+
+def translate(points, x, y):
+    """Move template points so their origin is at (x, y)"""
+    return [(x + px, y + py) for px, py in points]
+
+def _sepal_templates(bud_size=10):
+    sepals = []
+    for ux, uy in unit_vectors(4):
+        offset_x = int(bud_size * 0.7 * ux)
+        offset_y = int(bud_size * 0.7 * uy)
+        sepals.append([(0, 0), (offset_x - 3, offset_y - 3), (offset_x, offset_y), (offset_x + 3, offset_y + 3)])
+    return sepals
+
+def _rose_petals(flower_radius=FLOWER_RADIUS):
+    outer = []
+    for ux, uy in unit_vectors(16):
+        offset_x = int(flower_radius * 0.9 * ux)
+        offset_y = int(flower_radius * 0.9 * uy)
+        # (left, top, size) of the petal and of its highlight
+        outer.append(((offset_x * 0.5 - flower_radius * 0.4, offset_y * 0.5 - flower_radius * 0.4, flower_radius * 0.8),
+                      (offset_x * 0.5 - flower_radius * 0.2, offset_y * 0.5 - flower_radius * 0.2, flower_radius * 0.4)))
+    inner = []
+    for ux, uy in unit_vectors(8, 22.5):
+        offset_x = int(flower_radius * 0.4 * ux)
+        offset_y = int(flower_radius * 0.4 * uy)
+        inner.append((offset_x * 0.5 - flower_radius * 0.3, offset_y * 0.5 - flower_radius * 0.3, flower_radius * 0.6))
+    return outer, inner
+
+def _sunflower_petals(flower_radius=FLOWER_RADIUS):
+    petal_length = flower_radius * 1.5
+    petals = []
+    for (ux, uy), (left_x, left_y), (right_x, right_y) in zip(unit_vectors(20), unit_vectors(20, -15), unit_vectors(20, 15)):
+        start = (int(flower_radius * 0.4 * ux), int(flower_radius * 0.4 * uy))
+        end = (int(petal_length * ux), int(petal_length * uy))
+        control1 = (int(petal_length * 0.5 * left_x), int(petal_length * 0.5 * left_y))
+        control2 = (int(petal_length * 0.5 * right_x), int(petal_length * 0.5 * right_y))
+        # Petal polygon and the highlight line along its middle
+        petals.append(([start, control1, end, control2], (start, end)))
+    return petals
+
+def _daisy_petals(flower_radius=FLOWER_RADIUS):
+    petal_length = flower_radius * 1.2
+    petal_width = flower_radius * 0.3
+    petals = []
+    for ux, uy in unit_vectors(16):
+        center_x = int((flower_radius * 0.5) * ux)
+        center_y = int((flower_radius * 0.5) * uy)
+        # Rotated rectangle around the petal center
+        points = []
+        for corner_x, corner_y in [(petal_width/2, -petal_length/2),
+                                   (petal_width/2, petal_length/2),
+                                   (-petal_width/2, petal_length/2),
+                                   (-petal_width/2, -petal_length/2)]:
+            points.append((center_x + corner_x * ux - corner_y * uy, center_y + corner_x * uy + corner_y * ux))
+        end = (center_x + int(petal_length * ux), center_y + int(petal_length * uy))
+        petals.append((points, ((center_x, center_y), end)))
+    return petals
+
+def _center_dots(count, max_distance, seed):
+    """Texture dots scattered over a flower center; fixed, so every redraw of a flower looks the same"""
+    rng = random.Random(seed)
+    dots = []
+    for _ in range(count):
+        angle = math.radians(rng.uniform(0, 360))
+        distance = rng.uniform(0, max_distance)
+        dots.append((int(distance * math.cos(angle)), int(distance * math.sin(angle))))
+    return dots
+
+SEPAL_TEMPLATES = _sepal_templates()
+ROSE_OUTER_PETALS, ROSE_INNER_PETALS = _rose_petals()
+SUNFLOWER_PETALS = _sunflower_petals()
+DAISY_PETALS = _daisy_petals()
+SUNFLOWER_CENTER_DOTS = _center_dots(40, FLOWER_RADIUS * 0.4, seed=1)
+DAISY_CENTER_DOTS = _center_dots(20, FLOWER_RADIUS * 0.3, seed=2)
+
+# Colours and seed shape shared by every plant and seed of a species
+PlantSpecies = namedtuple("PlantSpecies", ["stem_color", "leaf_color", "leaf_vein_color", "flower_color",
+                                           "flower_highlight", "center_color", "seed_color", "seed_highlight",
+                                           "seed_shape"])
+
+def _species(stem_color, leaf_color, flower_color, flower_highlight, center_color, seed_color, seed_highlight,
+             seed_shape):
+    leaf_vein_color = tuple(max(0, channel - 30) for channel in leaf_color)
+    return PlantSpecies(stem_color, leaf_color, leaf_vein_color, flower_color, flower_highlight, center_color,
+                        seed_color, seed_highlight, seed_shape)
+
+SPECIES = {
+    "rose": _species(
+        stem_color=(0, 100, 0),  # Dark green
+        leaf_color=(0, 150, 0),  # Medium green
+        flower_color=(255, 50, 50),  # Red
+        flower_highlight=(255, 150, 150),  # Light red
+        center_color=(150, 0, 0),  # Dark red
+        seed_color=(180, 50, 50),  # Reddish-brown
+        seed_highlight=(220, 100, 100),
+        seed_shape="oval"),
+    "sunflower": _species(
+        stem_color=(0, 120, 0),  # Green
+        leaf_color=(50, 150, 50),  # Light green
+        flower_color=(255, 200, 0),  # Golden yellow
+        flower_highlight=(255, 255, 100),  # Light yellow
+        center_color=(100, 50, 0),  # Brown
+        seed_color=(50, 50, 30),  # Dark brown
+        seed_highlight=(80, 80, 60),
+        seed_shape="teardrop"),
+    "daisy": _species(
+        stem_color=(0, 150, 0),  # Green
+        leaf_color=(100, 200, 100),  # Light green
+        flower_color=(255, 255, 255),  # White
+        flower_highlight=(255, 255, 230),  # Cream
+        center_color=(255, 255, 0),  # Yellow
+        seed_color=(200, 180, 140),  # Light tan
+        seed_highlight=(230, 210, 170),
+        seed_shape="round"),
+}
+DEFAULT_SPECIES = _species(
+    stem_color=(0, 128, 0),  # Green
+    leaf_color=(50, 150, 50),  # Light green
+    flower_color=(255, 100, 100),  # Pink
+    flower_highlight=(255, 200, 200),  # Light pink
+    center_color=(255, 255, 0),  # Yellow
+    seed_color=(150, 100, 50),  # Brown
+    seed_highlight=(180, 130, 80),
+    seed_shape="oval")
+
+def species_of(plant_type):
+    """Colours and seed shape of a plant type, or the default ones for an unknown type"""
+    return SPECIES.get(plant_type, DEFAULT_SPECIES)
+
+def _species_property(field):
+    """Expose one field of the object's species as a read-only attribute"""
+    def get(self):
+        return getattr(species_of(self.plant_type), field)
+    return property(get)
+
+# Each plant has its own random streams, one per purpose, derived from its random seed
+TRAITS_STREAM = 0
+SEEDS_STREAM = 1
+DROP_STREAM = 2
 
 class Seed:
-    def __init__(self, plant_type, x=0, y=0):
+    # Gardens can hold a great many seeds, so they have no per-instance __dict__
+    __slots__ = ("plant_type", "x", "y", "rotation", "atlas_bucket", "falling")
+    size = 12
+    
+    # Seed color and shape come from the plant type
+    color = _species_property("seed_color")
+    highlight_color = _species_property("seed_highlight")
+    shape = _species_property("seed_shape")
+    
+    def __init__(self, plant_type, x=0, y=0, rng=random, rotation=None):
         self.plant_type = plant_type
         self.x = x
         self.y = y
-        self.size = 12
-        self.rect = pygame.Rect(x - self.size/2, y - self.size/2, self.size, self.size)
         
-        # Set seed color and shape based on plant type
-        if plant_type == "rose":
-            self.color = (180, 50, 50)  # Reddish-brown
-            self.highlight_color = (220, 100, 100)
-            self.shape = "oval"
-        elif plant_type == "sunflower":
-            self.color = (50, 50, 30)  # Dark brown
-            self.highlight_color = (80, 80, 60)
-            self.shape = "teardrop"
-        elif plant_type == "daisy":
-            self.color = (200, 180, 140)  # Light tan
-            self.highlight_color = (230, 210, 170)
-            self.shape = "round"
-        else:
-            self.color = (150, 100, 50)  # Brown (default)
-            self.highlight_color = (180, 130, 80)
-            self.shape = "oval"
-        
-        # Add a random rotation to make seeds look more natural
-        self.rotation = random.randint(0, 360)
+        # Add a random rotation to make seeds look more natural; saved seeds bring theirs
+        self.rotation = rng.randint(0, 360) if rotation is None else rotation
+        self.atlas_bucket = seed_atlas.bucket(self.rotation)
+        self.falling = False  # Hidden while the garden animates it dropping to the ground
+    
+    @classmethod
+    def render_sprite(cls, plant_type, angle):
+        """Render a seed of the given type, rotated by angle, into a small sprite"""
+        # Texture dots are fixed per atlas entry so seeds no longer flicker
+        rng = random.Random(int(angle))
+        seed = cls(plant_type, rng=rng)
+        sprite = pygame.Surface((SEED_SPRITE_SIZE, SEED_SPRITE_SIZE), pygame.SRCALPHA)
+        center = SEED_SPRITE_SIZE // 2
+        seed.draw_shape(sprite, center, center, rng)
+        if angle:
+            sprite = pygame.transform.rotate(sprite, angle)
+        return sprite
+    
+    def bounds(self):
+        """Screen area the seed covers when drawn, including rotation"""
+        return pygame.Rect(self.x - SEED_SPRITE_SIZE * 3 // 4, self.y - SEED_SPRITE_SIZE * 3 // 4,
+                           SEED_SPRITE_SIZE * 3 // 2, SEED_SPRITE_SIZE * 3 // 2)
     
     def draw_at_position(self, surface, x, y):
         """Draw the seed at a specific position"""
         self.x = x
         self.y = y
-        self.rect = pygame.Rect(x - self.size/2, y - self.size/2, self.size, self.size)
-        
-        if self.shape == "oval":
+        seed_atlas.draw(surface, self.plant_type, self.atlas_bucket, x, y)
+    
+    def draw(self, surface, offset_x=0):
+        """Draw the seed where it is, shifted left by offset_x (the camera position)"""
+        seed_atlas.draw(surface, self.plant_type, self.atlas_bucket, self.x - offset_x, self.y)
+    
+    def draw_shape(self, surface, x, y, rng):
+        """Draw the seed shape centered on (x, y)"""
+        # One species lookup instead of one per colour
+        species = species_of(self.plant_type)
+        if species.seed_shape == "oval":
             # Draw oval-shaped seed
             seed_rect = pygame.Rect(x - self.size/2, y - self.size/4, self.size, self.size/2)
-            pygame.draw.ellipse(surface, self.color, seed_rect)
+            pygame.draw.ellipse(surface, species.seed_color, seed_rect)
             # Add seed details - line down middle
-            seed_line_color = (max(0, self.color[0]-20), max(0, self.color[1]-20), max(0, self.color[2]-20))
+            seed_line_color = tuple(max(0, channel - 20) for channel in species.seed_color)
             pygame.draw.line(surface, seed_line_color,
                            (x, y - self.size/4), (x, y + self.size/4), 1)
             # Add highlight
-            pygame.draw.ellipse(surface, self.highlight_color, 
+            pygame.draw.ellipse(surface, species.seed_highlight, 
                              pygame.Rect(x - self.size/4, y - self.size/6, self.size/3, self.size/6))
             
-        elif self.shape == "teardrop":
+        elif species.seed_shape == "teardrop":
             # Draw teardrop-shaped sunflower seed
             # Main body
-            pygame.draw.ellipse(surface, self.color, 
+            pygame.draw.ellipse(surface, species.seed_color, 
                              pygame.Rect(x - self.size/3, y - self.size/2, self.size/1.5, self.size))
             # Pointed end
             points = [
@@ -60,70 +255,81 @@ class Seed:
                 (x - self.size/4, y + self.size/3),
                 (x + self.size/4, y + self.size/3)
             ]
-            pygame.draw.polygon(surface, self.color, points)
+            pygame.draw.polygon(surface, species.seed_color, points)
             # Stripe
-            pygame.draw.line(surface, self.highlight_color, 
+            pygame.draw.line(surface, species.seed_highlight, 
                            (x, y - self.size/2), (x, y + self.size/2), 1)
             
-        elif self.shape == "round":
+        elif species.seed_shape == "round":
             # Draw round seed with details
-            pygame.draw.circle(surface, self.color, (x, y), self.size/2)
+            pygame.draw.circle(surface, species.seed_color, (x, y), self.size/2)
             # Add seed texture - little dots
             for _ in range(3):
-                dot_x = x + random.randint(-int(self.size/3), int(self.size/3))
-                dot_y = y + random.randint(-int(self.size/3), int(self.size/3))
-                pygame.draw.circle(surface, self.highlight_color, (dot_x, dot_y), 1)
+                dot_x = x + rng.randint(-int(self.size/3), int(self.size/3))
+                dot_y = y + rng.randint(-int(self.size/3), int(self.size/3))
+                pygame.draw.circle(surface, species.seed_highlight, (dot_x, dot_y), 1)
         
         else:
             # Fallback to simple seed shape
-            pygame.draw.circle(surface, self.color, (x, y), self.size/2)
+            pygame.draw.circle(surface, species.seed_color, (x, y), self.size/2)
             pygame.draw.circle(surface, (0, 0, 0), (x, y), self.size/2, 1)  # Black outline
 
-class Plant:
-    def __init__(self, plant_type, x, y):
+class BasePlant:
+    """Everything about a plant except where its simulated state is kept
+
+    Plant keeps growth stage, timers, levels and the like in slots of its
+    own; StoredPlant (plant_store.py) reads them from a PlantStore row.
+    """
+    # Growth parameters shared by all plants; parameter sweeps change them per run
+    growth_time = NATURAL_GROWTH_TIME
+    lifetime_range = PLANT_LIFETIME
+    seed_yield = SEED_YIELD
+    
+    # Gardens can hold a great many plants, so they have no per-instance __dict__
+    __slots__ = ("plant_type", "x", "y", "seeds", "random_seed", "variation", "lean_direction",
+                 "geometry", "geometry_key")
+    
+    # Plant colors come from the plant type
+    stem_color = _species_property("stem_color")
+    leaf_color = _species_property("leaf_color")
+    leaf_vein_color = _species_property("leaf_vein_color")
+    flower_color = _species_property("flower_color")
+    flower_highlight = _species_property("flower_highlight")
+    center_color = _species_property("center_color")
+    
+    def __init__(self, plant_type, x, y, current_time=None, random_seed=None, traits=None):
         self.plant_type = plant_type
         self.x = x
         self.y = y
         self.growth_stage = 0  # 0: seed, 1: small stalk, 2: stalk with few leaves, etc.
-        self.growth_timer = time.time()
+        self.growth_timer = time.monotonic() if current_time is None else current_time
         self.water_level = 0
         self.sun_level = 0
-        self.growth_speed = 10  # Seconds between natural growth
+        self.growth_speed = self.growth_time  # Seconds between natural growth
         self.seeds = []
         self.alive = True
-        self.lifetime = random.randint(30, 60)  # Seconds plant will live after maturity
+        # Gardens pass a seed from their own generator; the plant's random streams
+        # come from it, so results do not depend on the order plants are updated in
+        self.random_seed = random.getrandbits(32) if random_seed is None else random_seed
         self.maturity_time = 0  # When the plant reached maturity
+        # Saved plants bring the (lifetime, variation, lean_direction) they were drawn with
+        if traits is None:
+            rng = self.random_stream(TRAITS_STREAM)
+            # Seconds plant will live after maturity, then random variation to make plants look unique
+            traits = (rng.randint(*self.lifetime_range), rng.uniform(0.9, 1.1),
+                      rng.choice([-1, 1]) * rng.uniform(0.8, 1.2))
+        self.lifetime, self.variation, self.lean_direction = traits
         
-        # Random variation to make plants look unique
-        self.variation = random.uniform(0.9, 1.1)
-        self.lean_direction = random.choice([-1, 1]) * random.uniform(0.8, 1.2)
+        # Stem and leaf outlines, rebuilt by body_geometry when the plant grows
+        self.geometry = None
+        self.geometry_key = None
         
-        # Set plant colors based on type
-        if plant_type == "rose":
-            self.stem_color = (0, 100, 0)  # Dark green
-            self.leaf_color = (0, 150, 0)  # Medium green
-            self.flower_color = (255, 50, 50)  # Red
-            self.flower_highlight = (255, 150, 150)  # Light red
-            self.center_color = (150, 0, 0)  # Dark red
-        elif plant_type == "sunflower":
-            self.stem_color = (0, 120, 0)  # Green
-            self.leaf_color = (50, 150, 50)  # Light green
-            self.flower_color = (255, 200, 0)  # Golden yellow
-            self.flower_highlight = (255, 255, 100)  # Light yellow
-            self.center_color = (100, 50, 0)  # Brown
-        elif plant_type == "daisy":
-            self.stem_color = (0, 150, 0)  # Green
-            self.leaf_color = (100, 200, 100)  # Light green
-            self.flower_color = (255, 255, 255)  # White
-            self.flower_highlight = (255, 255, 230)  # Cream
-            self.center_color = (255, 255, 0)  # Yellow
-        else:
-            # Default colors
-            self.stem_color = (0, 128, 0)  # Green
-            self.leaf_color = (50, 150, 50)  # Light green
-            self.flower_color = (255, 100, 100)  # Pink
-            self.flower_highlight = (255, 200, 200)  # Light pink
-            self.center_color = (255, 255, 0)  # Yellow
+        # How many of its garden's water and sun presses the plant has applied
+        self.boost_epoch = 0
+    
+    def random_stream(self, stream):
+        """Random generator for one of the plant's streams; the same every time it is asked for"""
+        return random.Random(self.random_seed * 4 + stream)
     
     def water(self):
         """Water the plant to help it grow"""
@@ -142,6 +348,34 @@ class Plant:
             self.water_level = 0
             self.sun_level = 0
     
+    def catch_up(self, boosts, last_boost):
+        """Apply the water and sun presses made since the plant last caught up
+
+        boosts counts every press the garden has had and last_boost is the
+        latest one ("water" or "sun"). The garden ignores the same button
+        twice in a row, so presses alternate and every earlier one follows
+        from the latest. The result is the same as applying them one by one.
+        """
+        pending = boosts - self.boost_epoch
+        self.boost_epoch = boosts
+        # One press at a time until both levels are empty, which takes at most two
+        while pending and (self.water_level or self.sun_level):
+            # Odd counts back from the end are presses of the latest button
+            if (last_boost == "water") == (pending % 2 == 1):
+                self.water()
+            else:
+                self.provide_sunlight()
+            pending -= 1
+        # From empty levels every pair of presses is one boost; there are only six stages to grow
+        for _ in range(min(pending // 2, 6)):
+            self.grow()
+        # A press left over fills one level; the other is empty, so there is no boost
+        if pending % 2:
+            if last_boost == "water":
+                self.water_level += 1
+            else:
+                self.sun_level += 1
+    
     def grow(self):
         """Advance the plant to the next growth stage"""
         if self.growth_stage < 6:  # Max stage is 6 (fully grown with seeds)
@@ -153,15 +387,17 @@ class Plant:
     
     def create_seeds(self):
         """Create seeds for a fully grown plant"""
-        seed_count = random.randint(2, 4)
+        rng = self.random_stream(SEEDS_STREAM)
+        seed_count = rng.randint(*self.seed_yield)
         for i in range(seed_count):
-            seed_x = self.x + random.randint(-30, 30)
-            seed_y = self.y - random.randint(80, 120)  # Seeds at top of plant
-            self.seeds.append(Seed(self.plant_type, seed_x, seed_y))
+            seed_x = self.x + rng.randint(-SEED_SPREAD, SEED_SPREAD)
+            seed_y = self.y - rng.randint(80, 120)  # Seeds at top of plant
+            self.seeds.append(Seed(self.plant_type, seed_x, seed_y, rng))
     
-    def update(self):
+    def update(self, current_time=None):
         """Update the plant's growth over time"""
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.monotonic()
         
         # Only update if plant is alive
         if self.alive:
@@ -182,328 +418,289 @@ class Plant:
                 if current_time - self.maturity_time > self.lifetime:
                     self.die()
     
+    def next_event_time(self):
+        """Time at which update() will next change this plant, or None if never"""
+        if not self.alive:
+            return None
+        if self.growth_stage < 6:
+            return self.growth_timer + self.growth_speed
+        # Plants matured by a water/sun boost have no maturity time and never die on their own
+        if self.maturity_time > 0:
+            return self.maturity_time + self.lifetime
+        return None
+    
     def die(self):
         """Plant dies and drops seeds to the ground"""
         self.alive = False
         
         # Drop all seeds to the ground
         soil_y = self.y  # Soil level is at plant's base
+        rng = self.random_stream(DROP_STREAM)
         for seed in self.seeds:
             # Randomize falling position
-            seed.x = self.x + random.randint(-50, 50)
-            seed.y = soil_y - random.randint(10, 30)  # Slightly above the soil
+            seed.x = self.x + rng.randint(-50, 50)
+            seed.y = soil_y - rng.randint(10, 30)  # Slightly above the soil
+    
+    def sprite_key(self, detail=DETAIL_FULL):
+        """Key identifying how this plant looks at a level of detail, shared by all similar plants"""
+        # Seedlings and small stalks are straight, so lean only matters once the stem curves
+        if self.growth_stage < 2 or detail == DETAIL_BLOB:
+            return (self.plant_type, self.growth_stage, 0, detail)
+        return (self.plant_type, self.growth_stage, round(self.lean_direction / LEAN_QUANTUM), detail)
+
+    def render_sprite(self, lean_bucket, detail=DETAIL_FULL):
+        """Render the plant body once into a transparent sprite surface"""
+        if detail == DETAIL_FULL:
+            sprite = pygame.Surface(SPRITE_SIZE, pygame.SRCALPHA)
+        else:
+            # Simplified sprites use a colour key instead of per-pixel alpha; with
+            # RLE acceleration they blit several times faster
+            sprite = pygame.Surface(SPRITE_SIZE)
+            sprite.fill(SPRITE_COLORKEY)
+            sprite.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        self.draw_body(sprite, SPRITE_ANCHOR[0], SPRITE_ANCHOR[1], lean_bucket * LEAN_QUANTUM, detail=detail)
+        return sprite
+
+    def bounds(self):
+        """Screen area the plant body can cover at any growth stage"""
+        return pygame.Rect(self.x - SPRITE_ANCHOR[0], self.y - SPRITE_ANCHOR[1], SPRITE_SIZE[0], SPRITE_SIZE[1])
+    
+    def draw(self, surface, offset_x=0):
+        """Draw the plant based on its current growth stage, shifted left by offset_x"""
+        self.draw_plant(surface, offset_x)
+        self.draw_seeds(surface, offset_x)
+    
+    def draw_plant(self, surface, offset_x=0, detail=DETAIL_FULL):
+        """Draw the plant itself, without its seeds, at the given level of detail"""
+        # Draw the plant only if it's alive
+        if self.alive and self.growth_stage >= 1:
+            x = self.x - offset_x
+            if sprite_cache.enabled:
+                key = self.sprite_key(detail)
+                sprite = sprite_cache.get(key, lambda: self.render_sprite(key[2], detail))
+                surface.blit(sprite, (x - SPRITE_ANCHOR[0], self.y - SPRITE_ANCHOR[1]))
+            else:
+                self.draw_body(surface, x, self.y, self.lean_direction, detail=detail)
     
-    def draw(self, surface):
-        """Draw the plant based on its current growth stage"""
-        # Draw seeds for both alive and dead plants
+    def draw_seeds(self, surface, offset_x=0):
+        """Draw seeds for both alive and dead plants, on top of the flower"""
         for seed in self.seeds:
-            seed.draw_at_position(surface, seed.x, seed.y)
-            
-        # If plant is dead, don't draw the plant itself
-        if not self.alive:
+            if not seed.falling:
+                seed.draw(surface, offset_x)
+    
+    def body_geometry(self, lean, segments=None):
+        """Stem polyline and (leaf polygon, vein) outlines relative to the base of the stem
+
+        Built once per growth stage, lean and stem resolution and reused until one changes.
+        """
+        key = (self.growth_stage, lean, segments)
+        if self.geometry_key == key:
+            return self.geometry
+
+        stem_height = 30 + (self.growth_stage * 20)
+        if segments is None:
+            # Shorter stems need fewer segments to look just as smooth
+            segments = max(MIN_STEM_SEGMENTS, round(STEM_SEGMENTS * stem_height / MAX_STEM_HEIGHT))
+
+        # Stem as a quadratic bezier curve bending towards the lean
+        control_x = 10 * lean
+        stem = []
+        for i in range(segments + 1):
+            t = i / segments
+            stem.append((2*(1-t)*t * control_x,
+                         -2*(1-t)*t * stem_height/2 - t**2 * stem_height))
+
+        leaves = []
+        # First set of small leaves
+        leaf_size = 7 + (self.growth_stage * 3)
+        base_y = -stem_height * 0.3
+        for side in (-1, 1):
+            leaf = [
+                (0, base_y),
+                (side * leaf_size, base_y - leaf_size/2),
+                (side * leaf_size/2, base_y - leaf_size/4),
+                (0, base_y)
+            ]
+            leaves.append((leaf, [(0, base_y), (side * leaf_size/2, base_y - leaf_size/3)]))
+
+        if self.growth_stage >= 3:
+            # Second set of leaves
+            leaf_size = 10 + (self.growth_stage * 3)
+            base_y = -stem_height * 0.6
+            for side in (-1, 1):
+                leaf = [
+                    (0, base_y),
+                    (side * leaf_size, base_y - leaf_size/2),
+                    (side * leaf_size/2, base_y - leaf_size/4),
+                    (0, base_y)
+                ]
+                leaves.append((leaf, [(0, base_y), (side * leaf_size/2, base_y - leaf_size/3)]))
+
+        if self.growth_stage >= 4:
+            # Larger leaves with slight serration
+            leaf_size = 15 + (self.growth_stage * 3)
+            base_y = -stem_height * 0.8
+            for side in (-1, 1):
+                leaf = [
+                    (0, base_y),
+                    (side * leaf_size * 0.3, base_y - leaf_size * 0.2),
+                    (side * leaf_size * 0.6, base_y - leaf_size * 0.3),
+                    (side * leaf_size, base_y - leaf_size * 0.5),
+                    (side * leaf_size * 0.8, base_y - leaf_size * 0.7),
+                    (side * leaf_size * 0.4, base_y - leaf_size * 0.6),
+                    (0, base_y - leaf_size * 0.2),
+                ]
+                leaves.append((leaf, [(0, base_y), (side * leaf_size * 0.6, base_y - leaf_size * 0.4)]))
+
+        self.geometry = (stem, leaves)
+        self.geometry_key = key
+        return self.geometry
+
+    def draw_body(self, surface, x, y, lean, segments=None, detail=DETAIL_FULL):
+        """Draw the stem, leaves and flower with the base of the stem at (x, y)
+
+        segments overrides the stem's bezier resolution, e.g. for distant plants.
+        detail is one of DETAIL_LEVELS.
+        """
+        if detail == DETAIL_BLOB:
+            self.draw_blob(surface, x, y)
             return
-            
-        # Draw the plant only if it's alive
+        if detail == DETAIL_SIMPLE and segments is None:
+            segments = MIN_STEM_SEGMENTS
+        # One species lookup instead of one per colour
+        species = species_of(self.plant_type)
+        
         if self.growth_stage >= 1:
-            # Draw stem with a slightly curved look for more natural appearance
             stem_height = 30 + (self.growth_stage * 20)
             stem_width = 2 + self.growth_stage // 2
+            stem_top_x, stem_top_y = x, y - stem_height
             
-            # Instead of a straight line, draw a slightly curved stem
             if self.growth_stage >= 2:
-                # Curved stem for more mature plants
-                curve_amount = 10 * self.lean_direction
-                control_point_x = self.x + curve_amount
-                
-                # Draw stem as a bezier curve
-                points = []
-                steps = 20
-                for i in range(steps + 1):
-                    t = i / steps
-                    # Quadratic bezier curve
-                    bx = (1-t)**2 * self.x + 2*(1-t)*t * control_point_x + t**2 * self.x
-                    by = (1-t)**2 * self.y + 2*(1-t)*t * (self.y - stem_height/2) + t**2 * (self.y - stem_height)
-                    points.append((bx, by))
-                
-                # Draw stem segments
-                for i in range(len(points) - 1):
-                    pygame.draw.line(surface, self.stem_color, points[i], points[i+1], stem_width)
-                
-                # Store the top point for attaching flower
-                stem_top_x, stem_top_y = self.x, self.y - stem_height
+                # Curved stem and leaves for more mature plants, from cached outlines
+                stem, leaves = self.body_geometry(lean, segments)
+                pygame.draw.lines(surface, species.stem_color, False, translate(stem, x, y), stem_width)
+                for leaf, vein in leaves:
+                    pygame.draw.polygon(surface, species.leaf_color, translate(leaf, x, y))
+                    if detail == DETAIL_FULL:
+                        pygame.draw.line(surface, species.leaf_vein_color, *translate(vein, x, y), 1)
             else:
                 # Simple straight stem for young plants
-                pygame.draw.line(surface, self.stem_color, 
-                               (self.x, self.y), 
-                               (self.x, self.y - stem_height), 
+                pygame.draw.line(surface, species.stem_color, 
+                               (x, y), 
+                               (stem_top_x, stem_top_y), 
                                stem_width)
-                stem_top_x, stem_top_y = self.x, self.y - stem_height
-        
-        if self.growth_stage >= 2:
-            # Draw first set of small leaves
-            leaf_size = 7 + (self.growth_stage * 3)
-            # Left leaf
-            leaf_angle = random.randint(-20, -10)
-            leaf_points = [
-                (self.x, self.y - stem_height * 0.3),
-                (self.x - leaf_size, self.y - stem_height * 0.3 - leaf_size/2),
-                (self.x - leaf_size/2, self.y - stem_height * 0.3 - leaf_size/4),
-                (self.x, self.y - stem_height * 0.3)
-            ]
-            pygame.draw.polygon(surface, self.leaf_color, leaf_points)
-            # Add leaf vein
-            leaf_vein_color = (max(0, self.leaf_color[0]-30), max(0, self.leaf_color[1]-30), max(0, self.leaf_color[2]-30))
-            pygame.draw.line(surface, leaf_vein_color,
-                           (self.x, self.y - stem_height * 0.3),
-                           (self.x - leaf_size/2, self.y - stem_height * 0.3 - leaf_size/3), 1)
-            
-            # Right leaf
-            leaf_points = [
-                (self.x, self.y - stem_height * 0.3),
-                (self.x + leaf_size, self.y - stem_height * 0.3 - leaf_size/2),
-                (self.x + leaf_size/2, self.y - stem_height * 0.3 - leaf_size/4),
-                (self.x, self.y - stem_height * 0.3)
-            ]
-            pygame.draw.polygon(surface, self.leaf_color, leaf_points)
-            # Add leaf vein
-            leaf_vein_color = (max(0, self.leaf_color[0]-30), max(0, self.leaf_color[1]-30), max(0, self.leaf_color[2]-30))
-            pygame.draw.line(surface, leaf_vein_color,
-                           (self.x, self.y - stem_height * 0.3),
-                           (self.x + leaf_size/2, self.y - stem_height * 0.3 - leaf_size/3), 1)
-        
-        if self.growth_stage >= 3:
-            # Draw second set of leaves
-            leaf_size = 10 + (self.growth_stage * 3)
-            # Left leaf
-            leaf_points = [
-                (self.x, self.y - stem_height * 0.6),
-                (self.x - leaf_size, self.y - stem_height * 0.6 - leaf_size/2),
-                (self.x - leaf_size/2, self.y - stem_height * 0.6 - leaf_size/4),
-                (self.x, self.y - stem_height * 0.6)
-            ]
-            pygame.draw.polygon(surface, self.leaf_color, leaf_points)
-            # Add leaf vein
-            leaf_vein_color = (max(0, self.leaf_color[0]-30), max(0, self.leaf_color[1]-30), max(0, self.leaf_color[2]-30))
-            pygame.draw.line(surface, leaf_vein_color,
-                           (self.x, self.y - stem_height * 0.6),
-                           (self.x - leaf_size/2, self.y - stem_height * 0.6 - leaf_size/3), 1)
-            
-            # Right leaf
-            leaf_points = [
-                (self.x, self.y - stem_height * 0.6),
-                (self.x + leaf_size, self.y - stem_height * 0.6 - leaf_size/2),
-                (self.x + leaf_size/2, self.y - stem_height * 0.6 - leaf_size/4),
-                (self.x, self.y - stem_height * 0.6)
-            ]
-            pygame.draw.polygon(surface, self.leaf_color, leaf_points)
-            # Add leaf vein
-            leaf_vein_color = (max(0, self.leaf_color[0]-30), max(0, self.leaf_color[1]-30), max(0, self.leaf_color[2]-30))
-            pygame.draw.line(surface, leaf_vein_color,
-                           (self.x, self.y - stem_height * 0.6),
-                           (self.x + leaf_size/2, self.y - stem_height * 0.6 - leaf_size/3), 1)
-        
-        if self.growth_stage >= 4:
-            # Draw larger leaves
-            leaf_size = 15 + (self.growth_stage * 3)
-            # Left leaf - more detailed with slight serration
-            leaf_points = [
-                (self.x, self.y - stem_height * 0.8),
-                (self.x - leaf_size * 0.3, self.y - stem_height * 0.8 - leaf_size * 0.2),
-                (self.x - leaf_size * 0.6, self.y - stem_height * 0.8 - leaf_size * 0.3),
-                (self.x - leaf_size, self.y - stem_height * 0.8 - leaf_size * 0.5),
-                (self.x - leaf_size * 0.8, self.y - stem_height * 0.8 - leaf_size * 0.7),
-                (self.x - leaf_size * 0.4, self.y - stem_height * 0.8 - leaf_size * 0.6),
-                (self.x, self.y - stem_height * 0.8 - leaf_size * 0.2),
-            ]
-            pygame.draw.polygon(surface, self.leaf_color, leaf_points)
-            # Add leaf veins
-            leaf_vein_color = (max(0, self.leaf_color[0]-30), max(0, self.leaf_color[1]-30), max(0, self.leaf_color[2]-30))
-            pygame.draw.line(surface, leaf_vein_color,
-                           (self.x, self.y - stem_height * 0.8),
-                           (self.x - leaf_size * 0.6, self.y - stem_height * 0.8 - leaf_size * 0.4), 1)
-            
-            # Right leaf - with slight serration
-            leaf_points = [
-                (self.x, self.y - stem_height * 0.8),
-                (self.x + leaf_size * 0.3, self.y - stem_height * 0.8 - leaf_size * 0.2),
-                (self.x + leaf_size * 0.6, self.y - stem_height * 0.8 - leaf_size * 0.3),
-                (self.x + leaf_size, self.y - stem_height * 0.8 - leaf_size * 0.5),
-                (self.x + leaf_size * 0.8, self.y - stem_height * 0.8 - leaf_size * 0.7),
-                (self.x + leaf_size * 0.4, self.y - stem_height * 0.8 - leaf_size * 0.6),
-                (self.x, self.y - stem_height * 0.8 - leaf_size * 0.2),
-            ]
-            pygame.draw.polygon(surface, self.leaf_color, leaf_points)
-            # Add leaf veins
-            leaf_vein_color = (max(0, self.leaf_color[0]-30), max(0, self.leaf_color[1]-30), max(0, self.leaf_color[2]-30))
-            pygame.draw.line(surface, leaf_vein_color,
-                           (self.x, self.y - stem_height * 0.8),
-                           (self.x + leaf_size * 0.6, self.y - stem_height * 0.8 - leaf_size * 0.4), 1)
         
         if self.growth_stage >= 5:
             # Draw flower bud or flower
-            if self.growth_stage == 5:
+            if detail == DETAIL_SIMPLE:
+                self.draw_simple_flower(surface, stem_top_x, stem_top_y)
+            elif self.growth_stage == 5:
                 # Draw bud - more detailed with color transition
                 bud_size = 10
                 
                 # Outer green sepals
-                for i in range(4):
-                    angle = i * 90
-                    offset_x = int(bud_size * 0.7 * pygame.math.Vector2(1, 0).rotate(angle).x)
-                    offset_y = int(bud_size * 0.7 * pygame.math.Vector2(1, 0).rotate(angle).y)
-                    sepal_points = [
-                        (stem_top_x, stem_top_y),
-                        (stem_top_x + offset_x - 3, stem_top_y + offset_y - 3),
-                        (stem_top_x + offset_x, stem_top_y + offset_y),
-                        (stem_top_x + offset_x + 3, stem_top_y + offset_y + 3),
-                    ]
-                    pygame.draw.polygon(surface, self.stem_color, sepal_points)
+                for sepal in SEPAL_TEMPLATES:
+                    pygame.draw.polygon(surface, species.stem_color, translate(sepal, stem_top_x, stem_top_y))
                 
                 # Inner bud showing flower color
-                pygame.draw.circle(surface, self.flower_color, 
+                pygame.draw.circle(surface, species.flower_color, 
                                   (stem_top_x, stem_top_y), 
                                   bud_size * 0.5)
                 
             else:  # stage 6 (fully grown flower)
                 # Draw full flower - much more detailed and specific to plant type
-                flower_radius = 20
+                flower_radius = FLOWER_RADIUS
                 
                 if self.plant_type == "rose":
                     # Draw rose with multiple layers of petals
-                    # Outer petals
-                    for i in range(16):
-                        angle = i * (360 / 16)
-                        offset_x = int(flower_radius * 0.9 * pygame.math.Vector2(1, 0).rotate(angle).x)
-                        offset_y = int(flower_radius * 0.9 * pygame.math.Vector2(1, 0).rotate(angle).y)
-                        
-                        # Petal base color
-                        pygame.draw.ellipse(surface, self.flower_color, 
-                                          (stem_top_x + offset_x * 0.5 - flower_radius * 0.4,
-                                           stem_top_y + offset_y * 0.5 - flower_radius * 0.4,
-                                           flower_radius * 0.8, flower_radius * 0.8))
-                        
-                        # Petal highlight
-                        pygame.draw.ellipse(surface, self.flower_highlight, 
-                                          (stem_top_x + offset_x * 0.5 - flower_radius * 0.2,
-                                           stem_top_y + offset_y * 0.5 - flower_radius * 0.2,
-                                           flower_radius * 0.4, flower_radius * 0.4))
+                    # Outer petals: base color with a highlight
+                    for (left, top, size), (highlight_left, highlight_top, highlight_size) in ROSE_OUTER_PETALS:
+                        pygame.draw.ellipse(surface, species.flower_color, 
+                                          (stem_top_x + left, stem_top_y + top, size, size))
+                        pygame.draw.ellipse(surface, species.flower_highlight, 
+                                          (stem_top_x + highlight_left, stem_top_y + highlight_top,
+                                           highlight_size, highlight_size))
                     
                     # Inner petals
-                    for i in range(8):
-                        angle = i * (360 / 8) + 22.5
-                        offset_x = int(flower_radius * 0.4 * pygame.math.Vector2(1, 0).rotate(angle).x)
-                        offset_y = int(flower_radius * 0.4 * pygame.math.Vector2(1, 0).rotate(angle).y)
-                        
-                        pygame.draw.ellipse(surface, self.flower_color, 
-                                          (stem_top_x + offset_x * 0.5 - flower_radius * 0.3,
-                                           stem_top_y + offset_y * 0.5 - flower_radius * 0.3,
-                                           flower_radius * 0.6, flower_radius * 0.6))
+                    for left, top, size in ROSE_INNER_PETALS:
+                        pygame.draw.ellipse(surface, species.flower_color, 
+                                          (stem_top_x + left, stem_top_y + top, size, size))
                     
                     # Flower center
-                    pygame.draw.circle(surface, self.center_color, 
+                    pygame.draw.circle(surface, species.center_color, 
                                       (stem_top_x, stem_top_y), 
                                       flower_radius * 0.2)
                 
                 elif self.plant_type == "sunflower":
                     # Draw sunflower with detailed petals and textured center
                     # Draw petals - more elongated and pointed
-                    for i in range(20):
-                        angle = i * (360 / 20)
-                        
-                        # Create petal shape with bezier curves
-                        petal_length = flower_radius * 1.5
-                        
-                        start_x = stem_top_x + int(flower_radius * 0.4 * pygame.math.Vector2(1, 0).rotate(angle).x)
-                        start_y = stem_top_y + int(flower_radius * 0.4 * pygame.math.Vector2(1, 0).rotate(angle).y)
-                        
-                        end_x = stem_top_x + int(petal_length * pygame.math.Vector2(1, 0).rotate(angle).x)
-                        end_y = stem_top_y + int(petal_length * pygame.math.Vector2(1, 0).rotate(angle).y)
-                        
-                        control1_x = stem_top_x + int(petal_length * 0.5 * pygame.math.Vector2(1, 0).rotate(angle-15).x)
-                        control1_y = stem_top_y + int(petal_length * 0.5 * pygame.math.Vector2(1, 0).rotate(angle-15).y)
-                        
-                        control2_x = stem_top_x + int(petal_length * 0.5 * pygame.math.Vector2(1, 0).rotate(angle+15).x)
-                        control2_y = stem_top_y + int(petal_length * 0.5 * pygame.math.Vector2(1, 0).rotate(angle+15).y)
-                        
-                        # Create polygon for petal
-                        petal_points = [
-                            (start_x, start_y),
-                            (control1_x, control1_y),
-                            (end_x, end_y),
-                            (control2_x, control2_y)
-                        ]
-                        pygame.draw.polygon(surface, self.flower_color, petal_points)
+                    for petal, (start, end) in SUNFLOWER_PETALS:
+                        pygame.draw.polygon(surface, species.flower_color, translate(petal, stem_top_x, stem_top_y))
                         
                         # Add highlight to petal
-                        pygame.draw.line(surface, self.flower_highlight,
-                                       (start_x, start_y),
-                                       (end_x, end_y), 1)
+                        pygame.draw.line(surface, species.flower_highlight,
+                                       (stem_top_x + start[0], stem_top_y + start[1]),
+                                       (stem_top_x + end[0], stem_top_y + end[1]), 1)
                     
                     # Draw textured center
-                    pygame.draw.circle(surface, self.center_color, 
+                    pygame.draw.circle(surface, species.center_color, 
                                       (stem_top_x, stem_top_y), 
                                       flower_radius * 0.5)
                     
                     # Add seed texture to center
-                    for _ in range(40):
-                        seed_angle = random.uniform(0, 360)
-                        seed_distance = random.uniform(0, flower_radius * 0.4)
-                        seed_x = stem_top_x + int(seed_distance * pygame.math.Vector2(1, 0).rotate(seed_angle).x)
-                        seed_y = stem_top_y + int(seed_distance * pygame.math.Vector2(1, 0).rotate(seed_angle).y)
-                        
+                    for dot_x, dot_y in SUNFLOWER_CENTER_DOTS:
                         pygame.draw.circle(surface, (30, 30, 10), 
-                                         (seed_x, seed_y), 
+                                         (stem_top_x + dot_x, stem_top_y + dot_y), 
                                          2)
                 
                 else:  # daisy or default
                     # Draw daisy with pointed petals and detailed center
                     # Draw white petals
-                    for i in range(16):
-                        angle = i * (360 / 16)
-                        
-                        # Create elongated oval petals
-                        petal_length = flower_radius * 1.2
-                        petal_width = flower_radius * 0.3
-                        
-                        # Calculate petal points
-                        center_x = stem_top_x + int((flower_radius * 0.5) * pygame.math.Vector2(1, 0).rotate(angle).x)
-                        center_y = stem_top_y + int((flower_radius * 0.5) * pygame.math.Vector2(1, 0).rotate(angle).y)
-                        
-                        # Create a rotated rect for the petal
-                        petal_points = []
-                        for corner in [(petal_width/2, -petal_length/2), 
-                                      (petal_width/2, petal_length/2),
-                                      (-petal_width/2, petal_length/2),
-                                      (-petal_width/2, -petal_length/2)]:
-                            # Rotate corner and add to center position
-                            rotated_x = corner[0] * pygame.math.Vector2(1, 0).rotate(angle).x - corner[1] * pygame.math.Vector2(1, 0).rotate(angle).y
-                            rotated_y = corner[0] * pygame.math.Vector2(1, 0).rotate(angle).y + corner[1] * pygame.math.Vector2(1, 0).rotate(angle).x
-                            petal_points.append((center_x + rotated_x, center_y + rotated_y))
-                        
-                        pygame.draw.polygon(surface, self.flower_color, petal_points)
+                    for petal, (start, end) in DAISY_PETALS:
+                        pygame.draw.polygon(surface, species.flower_color, translate(petal, stem_top_x, stem_top_y))
                         
                         # Add subtle highlight to petal
-                        pygame.draw.line(surface, self.flower_highlight,
-                                       (center_x, center_y),
-                                       (center_x + int(petal_length * pygame.math.Vector2(1, 0).rotate(angle).x),
-                                        center_y + int(petal_length * pygame.math.Vector2(1, 0).rotate(angle).y)), 
-                                       1)
+                        pygame.draw.line(surface, species.flower_highlight,
+                                       (stem_top_x + start[0], stem_top_y + start[1]),
+                                       (stem_top_x + end[0], stem_top_y + end[1]), 1)
                     
                     # Draw yellow center
-                    pygame.draw.circle(surface, self.center_color, 
+                    pygame.draw.circle(surface, species.center_color, 
                                       (stem_top_x, stem_top_y), 
                                       flower_radius * 0.4)
                     
                     # Add texture to center
-                    for _ in range(20):
-                        dot_angle = random.uniform(0, 360)
-                        dot_distance = random.uniform(0, flower_radius * 0.3)
-                        dot_x = stem_top_x + int(dot_distance * pygame.math.Vector2(1, 0).rotate(dot_angle).x)
-                        dot_y = stem_top_y + int(dot_distance * pygame.math.Vector2(1, 0).rotate(dot_angle).y)
-                        
+                    for dot_x, dot_y in DAISY_CENTER_DOTS:
                         pygame.draw.circle(surface, (220, 180, 0), 
-                                         (dot_x, dot_y), 
+                                         (stem_top_x + dot_x, stem_top_y + dot_y), 
                                          1)
-        
-        # Draw seeds if the plant is fully grown
-        for seed in self.seeds:
-            seed.draw_at_position(surface, seed.x, seed.y)
\ No newline at end of file
+    
+    def draw_simple_flower(self, surface, x, y):
+        """Draw the bud or flower at (x, y) as plain discs, for DETAIL_SIMPLE"""
+        species = species_of(self.plant_type)
+        if self.growth_stage == 5:
+            pygame.draw.circle(surface, species.flower_color, (x, y), 5)
+        else:
+            flower, center = SIMPLE_FLOWER_RADII.get(self.plant_type, SIMPLE_FLOWER_RADII["daisy"])
+            pygame.draw.circle(surface, species.flower_color, (x, y), FLOWER_RADIUS * flower)
+            pygame.draw.circle(surface, species.center_color, (x, y), FLOWER_RADIUS * center)
+    
+    def draw_blob(self, surface, x, y):
+        """Draw a straight stem topped by one blob of colour, for DETAIL_BLOB"""
+        species = species_of(self.plant_type)
+        stem_height = 30 + (self.growth_stage * 20)
+        stem_top = (x, y - stem_height)
+        pygame.draw.line(surface, species.stem_color, (x, y), stem_top, 2 + self.growth_stage // 2)
+        if self.growth_stage >= 5:
+            pygame.draw.circle(surface, species.flower_color, stem_top, 5 if self.growth_stage == 5 else FLOWER_RADIUS)
+        elif self.growth_stage >= 2:
+            # Leaves as one green blob around the middle of the stem
+            pygame.draw.circle(surface, species.leaf_color, (x, y - stem_height * 0.6), 4 + self.growth_stage * 2)
+
+class Plant(BasePlant):
+    """A plant that keeps its simulated state in its own slots"""
+    __slots__ = ("growth_stage", "growth_timer", "water_level", "sun_level", "growth_speed", "alive", "lifetime",
+                 "maturity_time", "boost_epoch")
+
+# Shared atlas of pre-rendered seed sprites, built by Seed.render_sprite
+seed_atlas = SeedAtlas(Seed.render_sprite, PLANT_TYPES, SEED_ROTATION_BUCKETS)
@@ -0,0 +1,142 @@
+import numpy as np
+from plant import BasePlant
+
+class PlantStore:
+    """Structure-of-arrays storage for the simulation state of many plants"""
+    # Column name -> NumPy dtype
+    COLUMNS = {
+        "growth_stage": np.int8,
+        "growth_timer": np.float64,
+        "growth_speed": np.float64,
+        "maturity_time": np.float64,
+        "lifetime": np.float64,
+        "alive": np.bool_,
+        "water_level": np.int32,
+        "sun_level": np.int32,
+        "boost_epoch": np.int64,
+    }
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.count = 0
+        self.views = []  # Row -> StoredPlant using that row
+        for name, dtype in self.COLUMNS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+    def __len__(self):
+        return self.count
+
+    def allocate(self, view):
+        """Reserve a row for a new plant and return its index"""
+        if self.count == self.capacity:
+            self.resize(self.capacity * 2)
+        row = self.count
+        self.count += 1
+        self.views.append(view)
+        return row
+
+    def resize(self, capacity):
+        """Grow every column to the new capacity"""
+        for name, dtype in self.COLUMNS.items():
+            column = np.zeros(capacity, dtype=dtype)
+            column[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def release(self, view):
+        """Free a plant's row by moving the last row into it"""
+        row = view.row
+        last = self.count - 1
+        if row != last:
+            for name in self.COLUMNS:
+                column = getattr(self, name)
+                column[row] = column[last]
+            moved = self.views[last]
+            moved.row = row
+            self.views[row] = moved
+        self.views.pop()
+        self.count -= 1
+
+    def step(self, current_time):
+        """Advance natural growth, maturity and death for every plant at once
+
+        Returns the plants whose stage or alive flag changed.
+        """
+        n = self.count
+        stage = self.growth_stage[:n]
+        alive = self.alive[:n]
+
+        # Natural slow growth
+        growing = alive & (current_time - self.growth_timer[:n] > self.growth_speed[:n]) & (stage < 6)
+        stage[growing] += 1
+        self.growth_timer[:n][growing] = current_time
+
+        # Plants reaching maturity (stage 6) get seeds and a maturity time
+        matured = growing & (stage == 6)
+        self.maturity_time[:n][matured] = current_time
+
+        # Plants die once their lifetime after maturity has elapsed
+        maturity_time = self.maturity_time[:n]
+        dying = alive & (stage == 6) & (maturity_time > 0) & (current_time - maturity_time > self.lifetime[:n])
+
+        for row in np.flatnonzero(matured):
+            self.views[row].create_seeds()
+        for row in np.flatnonzero(dying):
+            self.views[row].die()
+        return [self.views[row] for row in np.flatnonzero(growing | dying)]
+
+    def boost(self, level, epoch):
+        """Apply water or sun press number epoch to every plant that has not had it yet
+
+        Adds one to level and applies growth boosts. Returns the plants that grew.
+        """
+        n = self.count
+        pending = self.boost_epoch[:n] < epoch
+        self.boost_epoch[:n][pending] = epoch
+        getattr(self, level)[:n][pending] += 1
+
+        # Same rule as Plant.check_growth_boost
+        boosted = pending & (self.water_level[:n] >= 1) & (self.sun_level[:n] >= 1)
+        stage = self.growth_stage[:n]
+        growing = boosted & (stage < 6)
+        stage[growing] += 1
+        self.water_level[:n][boosted] = 0
+        self.sun_level[:n][boosted] = 0
+
+        for row in np.flatnonzero(growing & (stage == 6)):
+            self.views[row].create_seeds()
+        return [self.views[row] for row in np.flatnonzero(growing)]
+
+def _column_property(name, cast):
+    """Expose one store column as a plain attribute of a StoredPlant"""
+    def get(self):
+        return cast(getattr(self.store, name)[self.row])
+
+    def set(self, value):
+        getattr(self.store, name)[self.row] = value
+
+    return property(get, set)
+
+class StoredPlant(BasePlant):
+    """A plant whose simulation state lives in a PlantStore row
+
+    Drawing and interaction use the normal Plant API; growth, maturity and
+    death are advanced for the whole store by PlantStore.step. Its only slots
+    are the store and row; every simulated attribute is a column property.
+    """
+    __slots__ = ("store", "row")
+    growth_stage = _column_property("growth_stage", int)
+    growth_timer = _column_property("growth_timer", float)
+    growth_speed = _column_property("growth_speed", float)
+    maturity_time = _column_property("maturity_time", float)
+    lifetime = _column_property("lifetime", float)
+    alive = _column_property("alive", bool)
+    water_level = _column_property("water_level", int)
+    sun_level = _column_property("sun_level", int)
+    boost_epoch = _column_property("boost_epoch", int)
+
+    def __init__(self, store, plant_type, x, y, current_time=None, random_seed=None, traits=None):
+        # The row must exist before BasePlant.__init__ assigns the column attributes
+        self.store = store
+        self.row = store.allocate(self)
+        super().__init__(plant_type, x, y, current_time, random_seed, traits)
@@ -0,0 +1,121 @@
+import json
+import time
+from collections import deque
+import pygame
+
+class FrameProfiler:
+    """Times the phases of every frame and keeps rolling percentiles
+
+    Call begin_frame() at the top of the frame, lap(name) at the end of each
+    phase and end_frame() once the frame is done. A lap covers the time since
+    the previous lap or the start of the frame. When disabled every call
+    returns immediately, so the profiler can stay wired into the main loop.
+    """
+    def __init__(self, enabled=False, window=300, overlay=True, trace_path=None):
+        self.enabled = enabled
+        self.overlay = overlay
+        self.window = window  # Frames kept for the percentiles
+        self.history = {}  # phase name -> deque of recent nanosecond timings, in first-seen order
+        self.frame = 0
+        self.frame_start = 0
+        self.last_lap = 0
+        self.laps = {}  # Timings of the frame in progress
+
+        # Per-frame traces as JSON lines, for offline analysis
+        self.trace = open(trace_path, "w") if enabled and trace_path else None
+
+        # Overlay text is re-rendered a few times a second, not every frame
+        self.font = None
+        self.overlay_image = None
+        self.overlay_rendered = 0
+        self.overlay_interval = 500_000_000  # Nanoseconds between overlay refreshes
+
+    def begin_frame(self):
+        """Start timing a new frame"""
+        if not self.enabled:
+            return
+        self.frame_start = self.last_lap = time.perf_counter_ns()
+        self.laps = {}
+
+    def lap(self, phase):
+        """Record the time since the previous lap under phase"""
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        # A phase lapped twice in one frame adds up
+        self.laps[phase] = self.laps.get(phase, 0) + now - self.last_lap
+        self.last_lap = now
+
+    def end_frame(self):
+        """Finish the frame: add its timings to the history and the trace"""
+        if not self.enabled:
+            return
+        total = time.perf_counter_ns() - self.frame_start
+        self.laps["frame"] = total
+        for phase, elapsed in self.laps.items():
+            samples = self.history.get(phase)
+            if samples is None:
+                samples = self.history[phase] = deque(maxlen=self.window)
+            samples.append(elapsed)
+        if self.trace is not None:
+            self.trace.write(json.dumps({"frame": self.frame, "start_ns": self.frame_start,
+                                         "phases": self.laps}) + "\n")
+        self.frame += 1
+
+    def percentiles(self, phase, points=(50, 95, 99)):
+        """Nearest-rank percentiles of the recent timings of phase, in milliseconds"""
+        samples = sorted(self.history.get(phase, ()))
+        if not samples:
+            return [0.0 for _ in points]
+        return [samples[min(len(samples) - 1, len(samples) * point // 100)] / 1e6 for point in points]
+
+    def report(self):
+        """Dictionary of phase -> (p50, p95, p99) milliseconds"""
+        return {phase: tuple(self.percentiles(phase)) for phase in self.history}
+
+    @property
+    def overlay_rect(self):
+        """Screen area the overlay covers, or None when nothing is shown"""
+        if not self.enabled or not self.overlay or self.overlay_image is None:
+            return None
+        return self.overlay_image.get_rect(topleft=(5, 5))
+
+    def render_overlay(self):
+        """Render the percentile table into a translucent panel"""
+        if self.font is None:
+            self.font = pygame.font.SysFont("monospace", 14)
+        lines = [f"{'phase':<14}{'p50':>7}{'p95':>7}{'p99':>7}"]
+        for phase, (p50, p95, p99) in self.report().items():
+            lines.append(f"{phase:<14}{p50:7.2f}{p95:7.2f}{p99:7.2f}")
+        glyphs = [self.font.render(line, True, (255, 255, 255)) for line in lines]
+        line_height = self.font.get_linesize()
+        panel = pygame.Surface((max(glyph.get_width() for glyph in glyphs) + 10, line_height * len(glyphs) + 10),
+                               pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 160))
+        for i, glyph in enumerate(glyphs):
+            panel.blit(glyph, (5, 5 + i * line_height))
+        return panel
+
+    def update_overlay(self):
+        """Re-render the overlay when it is due; returns the screen area that changed, if any"""
+        if not self.enabled or not self.overlay:
+            return None
+        now = time.perf_counter_ns()
+        if self.overlay_image is not None and now - self.overlay_rendered < self.overlay_interval:
+            return None
+        old_rect = self.overlay_rect
+        self.overlay_image = self.render_overlay()
+        self.overlay_rendered = now
+        return self.overlay_rect if old_rect is None else self.overlay_rect.union(old_rect)
+
+    def draw_overlay(self, surface):
+        """Draw the percentile table in the top left corner when the overlay is on"""
+        rect = self.overlay_rect
+        if rect is not None:
+            surface.blit(self.overlay_image, rect)
+
+    def close(self):
+        """Flush and close the trace file"""
+        if self.trace is not None:
+            self.trace.close()
+            self.trace = None
@@ -0,0 +1,215 @@
+"""Record the actions of a game and replay them without a window
+
+A recording starts with the garden as it was when the game began (its random
+seed plus an embedded save of its plants), followed by one small fixed-size
+record per action the player took. Replaying rebuilds that garden and feeds
+the actions to it at their recorded times as fast as the CPU allows, so real
+sessions can be used as performance regression fixtures.
+"""
+import argparse
+import os
+import struct
+import time
+import pygame
+from constants import PLANT_TYPES
+from frame_clock import FrameClock
+from garden import Garden
+from plant import Seed, seed_atlas
+from savefile import HEADER, load_garden, pack_header, pack_plants, read_file, seed_slots_needed
+from tools import ToolBar
+
+MAGIC = b"GREC"
+VERSION = 1
+# Magic, version, garden seed, world width, view width, garden height, toolbar height
+RECORDING_HEADER = struct.Struct("<4sHQIIII")
+# Time, action, plant type (NO_TYPE for none), x, y
+ACTION = struct.Struct("<dBBff")
+NO_TYPE = 255
+# "end" marks when the game was closed, so replays run for as long as the game did
+ACTIONS = ("plant", "water", "sun", "cut", "collect", "auto_plant", "take_seed", "store_seed", "end")
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+TYPE_INDEX = {plant_type: i for i, plant_type in enumerate(PLANT_TYPES)}
+
+class GardenActions:
+    """Everything the player can do to the garden and the seed storage
+
+    The game and replays both go through these methods, so a replay runs
+    exactly the same code as the game did. With a recorder every action is
+    also written to the recording.
+    """
+    def __init__(self, garden, toolbar, recorder=None):
+        self.garden = garden
+        self.toolbar = toolbar
+        self.recorder = recorder
+
+    def record(self, action, plant_type=None, x=0.0, y=0.0):
+        """Write an action to the recording, if there is one"""
+        if self.recorder is not None:
+            self.recorder.record(self.garden.clock.now, action, plant_type, x, y)
+
+    def plant(self, plant_type, x, y):
+        """Plant a seed held by the player at world position (x, y)"""
+        self.record("plant", plant_type, x, y)
+        self.garden.plant_seed(Seed(plant_type), x, y)
+
+    def water(self):
+        """Press the water button"""
+        self.record("water")
+        self.garden.water_plants()
+
+    def sun(self):
+        """Press the sun button"""
+        self.record("sun")
+        self.garden.provide_sunlight()
+
+    def cut(self, x, y):
+        """Use the scissors at world position (x, y)"""
+        self.record("cut", None, x, y)
+        self.garden.cut_flowers(x, y)
+
+    def collect(self, x, y):
+        """Click at world position (x, y) to pick up a seed into storage; returns the seed or None"""
+        self.record("collect", None, x, y)
+        seed = self.garden.check_seed_click((x, y))
+        if seed:
+            self.toolbar.add_seed(seed.plant_type)
+        return seed
+
+    def auto_plant(self, plant_type):
+        """Plant a stored seed at a random spot in the soil on screen"""
+        # The camera position decides where the seed can land, so it is recorded too
+        self.record("auto_plant", plant_type, self.garden.camera_x)
+        if self.toolbar.remove_seed(plant_type):
+            garden = self.garden
+            x = garden.camera_x + garden.rng.randint(50, garden.view_width - 50)
+            garden.plant_seed(Seed(plant_type), x, garden.height - 10)
+
+    def take_seed(self, plant_type):
+        """Take a seed out of storage; returns False if there are none left"""
+        self.record("take_seed", plant_type)
+        return self.toolbar.remove_seed(plant_type)
+
+    def store_seed(self, plant_type):
+        """Put a held seed back into storage"""
+        self.record("store_seed", plant_type)
+        self.toolbar.add_seed(plant_type)
+
+class ActionRecorder:
+    """Writes the starting garden and then every action to a recording file"""
+    def __init__(self, path, garden, seed_counts, toolbar_height):
+        self.file = open(path, "wb")
+        self.file.write(RECORDING_HEADER.pack(MAGIC, VERSION, garden.seed, garden.width, garden.view_width,
+                                    garden.height, toolbar_height))
+        # The starting garden, in the save file format
+        garden.catch_up(garden.plants)
+        seed_slots = seed_slots_needed(garden.plants)
+        records = pack_plants(garden.plants, seed_slots)
+        self.file.write(pack_header(seed_slots, len(records), garden, seed_counts))
+        records.tofile(self.file)
+
+    def record(self, at, action, plant_type, x, y):
+        """Append one action taken at simulated time at"""
+        plant_type = NO_TYPE if plant_type is None else TYPE_INDEX[plant_type]
+        self.file.write(ACTION.pack(at, ACTION_CODES[action], plant_type, x, y))
+
+    def close(self, at):
+        """Finish the recording when the game ends at simulated time at"""
+        self.record(at, "end", None, 0.0, 0.0)
+        self.file.close()
+
+def read_recording(path):
+    """Return (header fields, time the recording started, list of (time, action, plant type, x, y))"""
+    with open(path, "rb") as file:
+        header = file.read(RECORDING_HEADER.size)
+    if len(header) < RECORDING_HEADER.size:
+        raise ValueError(f"{path} is not a garden recording")
+    magic, version, *fields = RECORDING_HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a garden recording")
+    if version != VERSION:
+        raise ValueError(f"{path} has unsupported recording version {version}")
+
+    # Actions follow the embedded save
+    save = read_file(path, RECORDING_HEADER.size)
+    start_time = save.saved_time
+    with open(path, "rb") as file:
+        file.seek(RECORDING_HEADER.size + HEADER.size + save.records.nbytes)
+        data = file.read()
+    # A game that crashed may have left half an action at the end
+    data = data[:len(data) - len(data) % ACTION.size]
+    actions = []
+    for at, code, plant_type, x, y in ACTION.iter_unpack(data):
+        actions.append((at, ACTIONS[code], None if plant_type == NO_TYPE else PLANT_TYPES[plant_type], x, y))
+    return fields, start_time, actions
+
+class Replay:
+    """Rebuilds a recorded game's garden and plays its actions back on a fixed timestep"""
+    def __init__(self, path, dt=1/60):
+        (seed, width, view_width, height, toolbar_height), start_time, self.actions = read_recording(path)
+        # Same clock times as the recorded game, so actions and plants line up without shifting
+        self.clock = FrameClock(start=start_time)
+        self.garden = Garden(width, height, clock=self.clock, view_width=view_width, seed=seed)
+        self.toolbar = ToolBar(view_width, toolbar_height, 0, height)
+        load_garden(path, self.garden, self.toolbar.seed_counts, RECORDING_HEADER.size)
+        self.player = GardenActions(self.garden, self.toolbar)
+        self.dt = dt
+        self.frames = 0
+
+    def run(self, surface=None):
+        """Play every action back, drawing each frame to surface if given; returns elapsed real seconds"""
+        start = time.perf_counter()
+        actions = self.actions
+        next_action = 0
+        while next_action < len(actions):
+            # Like a game frame: the clock moves, the player acts, then the garden updates
+            self.clock.step(self.dt)
+            while next_action < len(actions) and actions[next_action][0] <= self.clock.now:
+                self.apply(*actions[next_action])
+                next_action += 1
+            self.garden.update()
+            if surface is not None:
+                self.garden.draw(surface)
+                self.toolbar.draw(surface, [])
+            self.frames += 1
+        return time.perf_counter() - start
+
+    def apply(self, at, action, plant_type, x, y):
+        """Repeat one recorded action"""
+        player = self.player
+        if action == "plant":
+            player.plant(plant_type, x, y)
+        elif action in ("cut", "collect"):
+            getattr(player, action)(x, y)
+        elif action == "auto_plant":
+            self.garden.camera_x = int(x)  # Whole pixels, like Garden.scroll
+            player.auto_plant(plant_type)
+        elif action in ("take_seed", "store_seed"):
+            getattr(player, action)(plant_type)
+        elif action != "end":
+            getattr(player, action)()
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded game without a window")
+    parser.add_argument("recording", help="file written by the game with RECORD_FILE set")
+    parser.add_argument("--dt", type=float, default=1/60, help="simulated seconds per step")
+    parser.add_argument("--draw", action="store_true", help="also draw every frame to an offscreen surface")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    replay = Replay(args.recording, args.dt)
+    surface = None
+    if args.draw:
+        pygame.display.set_mode((1, 1))
+        seed_atlas.build()
+        surface = pygame.Surface((replay.garden.view_width, replay.garden.height + replay.toolbar.height))
+    elapsed = replay.run(surface)
+    plants = replay.garden.plants
+    print(f"Replayed {len(replay.actions)} actions over {replay.frames} frames in {elapsed:.2f}s "
+          f"({elapsed / max(replay.frames, 1) * 1000:.3f}ms per frame)")
+    print(f"plants: {len(plants)}")
+    print(f"alive: {sum(1 for plant in plants if plant.alive)}")
+    print(f"seed counts: {replay.toolbar.seed_counts}")
+
+if __name__ == "__main__":
+    main()
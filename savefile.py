@@ -0,0 +1,344 @@
+"""Binary save files for gardens
+
+A save file is a fixed-size header followed by a table of fixed-width plant
+records. Each record carries its plant's seeds inline, so every plant sits at
+a known offset: the table can be memory-mapped for loading, and autosaves can
+patch single records in place.
+"""
+import os
+import queue
+import struct
+import threading
+import time
+from collections import namedtuple
+from operator import attrgetter
+import numpy as np
+from constants import PLANT_TYPES, SEED_YIELD
+from plant import Seed
+
+MAGIC = b"GRDN"
+VERSION = 2
+# Magic, version, seed slots per record, record count, clock time when saved, water and sun presses so far,
+# latest press (index into PRESSES), toolbar seed counts
+HEADER = struct.Struct(f"<4sHHIdQB{len(PLANT_TYPES)}i")
+PRESSES = (None, "water", "sun")
+SEED_SLOTS = SEED_YIELD[1]  # Most seeds a plant grows
+AUTOSAVE_BATCH = 2000  # Most changed plants an autosave packs per frame
+TYPE_INDEX = {plant_type: i for i, plant_type in enumerate(PLANT_TYPES)}
+
+SEED_RECORD = np.dtype([("x", "<f4"), ("y", "<f4"), ("rotation", "<i2")])
+
+# What read_file finds in a save
+SaveFile = namedtuple("SaveFile", "saved_time seed_counts boosts last_action records")
+
+def record_dtype(seed_slots=SEED_SLOTS):
+    """Packed little-endian plant record with room for seed_slots seeds"""
+    return np.dtype([
+        ("used", "u1"),  # 0 for free slots
+        ("plant_type", "u1"),
+        ("growth_stage", "i1"),
+        ("alive", "u1"),
+        ("seed_count", "u1"),
+        ("x", "<f4"),
+        ("y", "<f4"),
+        ("growth_timer", "<f8"),
+        ("growth_speed", "<f8"),
+        ("maturity_time", "<f8"),
+        ("lifetime", "<f8"),
+        ("water_level", "<i4"),
+        ("sun_level", "<i4"),
+        ("variation", "<f4"),
+        ("lean_direction", "<f4"),
+        ("random_seed", "<u4"),
+        ("boost_epoch", "<i8"),
+        ("seeds", SEED_RECORD, (seed_slots,)),
+    ])
+
+def pack_header(seed_slots, count, garden, seed_counts):
+    """Header bytes for a file of count records saved from garden now"""
+    return HEADER.pack(MAGIC, VERSION, seed_slots, count, garden.clock.now, garden.boosts,
+                       PRESSES.index(garden.last_action),
+                       *(seed_counts.get(plant_type, 0) for plant_type in PLANT_TYPES))
+
+# Plant attributes stored as they are, in record order
+PLANT_FIELDS = ("growth_stage", "alive", "x", "y", "growth_timer", "growth_speed", "maturity_time", "lifetime",
+                "water_level", "sun_level", "variation", "lean_direction", "random_seed", "boost_epoch")
+
+def pack_plants(plants, seed_slots=SEED_SLOTS):
+    """Record array holding plants in order"""
+    records = np.zeros(len(plants), dtype=record_dtype(seed_slots))
+    if not plants:
+        return records
+    # Filling whole columns is much faster than building records one by one
+    records["used"] = 1
+    records["plant_type"] = [TYPE_INDEX[plant.plant_type] for plant in plants]
+    for name in PLANT_FIELDS:
+        records[name] = list(map(attrgetter(name), plants))
+    records["seed_count"] = [len(plant.seeds) for plant in plants]
+
+    rows = []
+    slots = []
+    xs = []
+    ys = []
+    rotations = []
+    for row, plant in enumerate(plants):
+        if plant.seeds:
+            for slot, seed in enumerate(plant.seeds):
+                rows.append(row)
+                slots.append(slot)
+                xs.append(seed.x)
+                ys.append(seed.y)
+                rotations.append(seed.rotation)
+    if rows:
+        seeds = records["seeds"]
+        seeds["x"][rows, slots] = xs
+        seeds["y"][rows, slots] = ys
+        seeds["rotation"][rows, slots] = rotations
+    return records
+
+def seed_slots_needed(plants):
+    """Seed slots per record needed to hold every plant's seeds"""
+    return max([SEED_SLOTS] + [len(plant.seeds) for plant in plants])
+
+def write_file(path, header, records):
+    """Write a whole save file, replacing any old one only once it is complete"""
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(header)
+        records.tofile(file)
+    os.replace(temporary, path)
+
+def read_file(path, offset=0):
+    """Return a SaveFile with the header fields and memory-mapped records of a save file
+
+    offset is where the save starts, for saves stored inside other files.
+    """
+    with open(path, "rb") as file:
+        file.seek(offset)
+        header = file.read(HEADER.size)
+    if len(header) < HEADER.size or header[:4] != MAGIC:
+        raise ValueError(f"{path} is not a garden save file")
+    magic, version, seed_slots, count, saved_time, boosts, last_press, *counts = HEADER.unpack(header)
+    if version != VERSION:
+        raise ValueError(f"{path} has unsupported save version {version}")
+    if last_press >= len(PRESSES):
+        raise ValueError(f"{path} is not a garden save file")
+    dtype = record_dtype(seed_slots)
+    if count:
+        records = np.memmap(path, dtype=dtype, mode="r", offset=offset + HEADER.size, shape=(count,))
+    else:
+        records = np.zeros(0, dtype=dtype)
+    return SaveFile(saved_time, dict(zip(PLANT_TYPES, counts)), boosts, PRESSES[last_press], records)
+
+def save_garden(path, garden, seed_counts):
+    """Save every plant, seed and toolbar seed count"""
+    seed_slots = seed_slots_needed(garden.plants)
+    records = pack_plants(garden.plants, seed_slots)
+    write_file(path, pack_header(seed_slots, len(records), garden, seed_counts), records)
+
+def load_garden(path, garden, seed_counts, offset=0):
+    """Add the plants and seeds saved in path to an empty garden and restore seed_counts
+
+    Saved times are moved onto the garden's clock, so plants continue where
+    they were when the file was saved. Plants are rebuilt from their records
+    without drawing traits again and added to the garden all at once.
+    """
+    save = read_file(path, offset)
+    records = save.records[save.records["used"] == 1]
+    # Check what could make building plants fail before the garden is touched
+    if len(records) and records["plant_type"].max() >= len(PLANT_TYPES):
+        raise ValueError(f"{path} has plants of unknown types")
+    seed_counts.update(save.seed_counts)
+    shift = garden.clock.now - save.saved_time
+    # Plants that had not caught up on every press when saved still do after loading
+    garden.boosts = save.boosts
+    garden.last_action = save.last_action
+    if len(records):
+        garden.store_boosts = min(save.boosts, int(records["boost_epoch"].min()))
+    else:
+        garden.store_boosts = save.boosts
+
+    # Whole columns at once is much faster than reading records field by field
+    columns = [records[name].tolist() for name in
+               ("plant_type", "x", "y", "growth_stage", "alive", "growth_timer", "growth_speed",
+                "maturity_time", "lifetime", "water_level", "sun_level", "variation", "lean_direction",
+                "seed_count", "seeds", "random_seed", "boost_epoch")]
+    plants = []
+    for (plant_type, x, y, growth_stage, alive, growth_timer, growth_speed, maturity_time, lifetime,
+         water_level, sun_level, variation, lean_direction, seed_count, seeds, random_seed,
+         boost_epoch) in zip(*columns):
+        plant = garden.create_plant(PLANT_TYPES[plant_type], x, y, random_seed,
+                                    (lifetime, variation, lean_direction))
+        plant.growth_stage = growth_stage
+        plant.alive = bool(alive)
+        plant.growth_timer = growth_timer + shift
+        plant.growth_speed = growth_speed
+        # Zero means the plant has no maturity time
+        plant.maturity_time = maturity_time + shift if maturity_time > 0 else 0
+        plant.water_level = water_level
+        plant.sun_level = sun_level
+        plant.boost_epoch = boost_epoch
+        plant.seeds = [Seed(plant.plant_type, seed_x, seed_y, rotation=rotation)
+                       for seed_x, seed_y, rotation in seeds[:seed_count]]
+        plants.append(plant)
+    garden.add_plants(plants)
+
+class AutoSaver:
+    """Keeps a save file up to date by rewriting only the records of changed plants
+
+    Changed plants are packed on the calling thread a batch per frame and a
+    background thread writes the records, so the game loop never waits on
+    the disk. Water and sun presses only rewrite the header: records keep
+    the press count their plant has seen, and plants catch up when loaded.
+    Whole-file rewrites only happen at the start and when the file runs out
+    of record or seed slots; they are packed a batch per frame too and
+    written once complete.
+    """
+    def __init__(self, path, garden, seed_counts, interval=10.0):
+        self.path = path
+        self.garden = garden
+        self.seed_counts = seed_counts
+        self.interval = interval  # Real seconds between saves
+        self.last_save = time.monotonic()
+
+        self.slots = {}  # plant -> index of its record in the file
+        self.free_slots = []
+        self.seed_slots = SEED_SLOTS
+        self.pending = set()  # Changed plants not packed yet
+        self.boosts = garden.boosts  # Water and sun presses already saved
+        self.rewrite = None  # [records, plants, plants packed so far] of a whole-file save in progress
+
+        # Jobs for the writer thread: (header, rows, records), with rows None for a whole file
+        self.jobs = queue.Queue()
+        self.writer = threading.Thread(target=self.write_jobs, daemon=True)
+        self.writer.start()
+
+        garden.changed_plants = set()
+        self.save_all()
+
+    def header(self, count):
+        """Header bytes describing the current state of the file"""
+        return pack_header(self.seed_slots, count, self.garden, self.seed_counts)
+
+    def save_all(self):
+        """Start a rewrite of the whole file, with free slots for plants yet to come"""
+        plants = list(self.garden.plants)
+        # Changes from now on are saved once the rewrite is written
+        self.garden.changed_plants.clear()
+        self.pending.clear()
+        self.seed_slots = seed_slots_needed(plants)
+        count = max(64, len(plants) * 2)
+        self.slots = {plant: slot for slot, plant in enumerate(plants)}
+        self.free_slots = list(range(count - 1, len(plants) - 1, -1))
+        self.rewrite = [np.zeros(count, dtype=record_dtype(self.seed_slots)), plants, 0]
+
+    def continue_rewrite(self, limit=None):
+        """Pack up to limit more plants of the rewrite (all of them by default) and queue it once complete"""
+        records, plants, start = self.rewrite
+        end = len(plants) if limit is None else min(len(plants), start + limit)
+        batch = plants[start:end]
+        if any(len(plant.seeds) > self.seed_slots for plant in batch):
+            return self.save_all()  # Records need more seed slots
+        records[start:end] = pack_plants(batch, self.seed_slots)
+        # Plants removed since the rewrite started get empty records; their slots are freed with their change
+        plant_index = self.garden.plant_index
+        records["used"][start:end] = [plant in plant_index for plant in batch]
+        self.rewrite[2] = end
+        if end == len(plants):
+            self.rewrite = None
+            self.boosts = self.garden.boosts
+            self.jobs.put((self.header(len(records)), None, records))
+
+    def save_header(self):
+        """Queue a rewrite of just the header, for presses and seed counts"""
+        self.boosts = self.garden.boosts
+        count = len(self.slots) + len(self.free_slots)
+        self.jobs.put((self.header(count), [], np.zeros(0, dtype=record_dtype(self.seed_slots))))
+
+    def save_changes(self, limit=None):
+        """Queue the records of up to limit pending plants (all of them by default)"""
+        garden = self.garden
+        if limit is None or limit >= len(self.pending):
+            batch, self.pending = self.pending, set()
+        else:
+            batch = [self.pending.pop() for _ in range(limit)]
+        changed_slots = []
+        plants = []
+        removed_slots = []
+        for plant in batch:
+            if plant in garden.plant_index:
+                slot = self.slots.get(plant)
+                if slot is None:
+                    if not self.free_slots:
+                        return self.save_all()  # File is full
+                    slot = self.free_slots.pop()
+                    self.slots[plant] = slot
+                if len(plant.seeds) > self.seed_slots:
+                    return self.save_all()  # Records need more seed slots
+                changed_slots.append(slot)
+                plants.append(plant)
+            else:
+                # Removed from the garden; its slot is cleared and reused
+                slot = self.slots.pop(plant, None)
+                if slot is not None:
+                    removed_slots.append(slot)
+                    self.free_slots.append(slot)
+
+        records = np.concatenate([pack_plants(plants, self.seed_slots),
+                                  np.zeros(len(removed_slots), dtype=record_dtype(self.seed_slots))])
+        count = len(self.slots) + len(self.free_slots)
+        self.boosts = garden.boosts
+        self.jobs.put((self.header(count), changed_slots + removed_slots, records))
+
+    def take_changes(self):
+        """Move the plants the garden changed since the last call to the pending set"""
+        garden = self.garden
+        self.pending.update(garden.changed_plants)
+        garden.changed_plants.clear()
+        # Presses with no other change only need the new press count in the header
+        if garden.boosts != self.boosts and not self.pending and self.rewrite is None:
+            self.save_header()
+
+    def update(self):
+        """Call once per frame: starts a save every interval and packs the next batch"""
+        now = time.monotonic()
+        if now - self.last_save >= self.interval:
+            self.last_save = now
+            self.take_changes()
+        # Changes wait for a rewrite in progress, which would otherwise replace them
+        if self.rewrite is not None:
+            self.continue_rewrite(AUTOSAVE_BATCH)
+        elif self.pending:
+            self.save_changes(AUTOSAVE_BATCH)
+
+    def write_jobs(self):
+        """Writer thread: apply queued saves to the file in order"""
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            header, rows, records = job
+            if rows is None:
+                write_file(self.path, header, records)
+                continue
+            size = records.dtype.itemsize
+            with open(self.path, "r+b") as file:
+                # Records in file order, so the writes move forwards through the file
+                for i in np.argsort(rows):
+                    file.seek(HEADER.size + rows[i] * size)
+                    file.write(records[i].tobytes())
+                file.seek(0)
+                file.write(header)
+
+    def close(self):
+        """Save the last changes and wait for everything to reach the disk"""
+        self.take_changes()
+        # Either can start a new rewrite when the file runs short of slots, so go on until both are done
+        while self.rewrite is not None or self.pending:
+            if self.rewrite is not None:
+                self.continue_rewrite()
+            else:
+                self.save_changes()
+        self.save_header()
+        self.jobs.put(None)
+        self.writer.join()
@@ -0,0 +1,40 @@
+import heapq
+import itertools
+
+class GrowthScheduler:
+    """Priority queue holding the next growth or death deadline of each plant"""
+    def __init__(self):
+        self.queue = []  # Heap of (deadline, order, plant)
+        self.deadlines = {}  # plant -> deadline of its live queue entry
+        self.order = itertools.count()  # Tie-breaker so plants are never compared
+
+    def __len__(self):
+        return len(self.deadlines)
+
+    def schedule(self, plant):
+        """Queue the plant's next event, replacing any earlier entry"""
+        deadline = plant.next_event_time()
+        if deadline is None:
+            # Nothing left to happen on its own (dead, or matured by a boost)
+            self.deadlines.pop(plant, None)
+            return
+        if self.deadlines.get(plant) == deadline:
+            return
+        # Older heap entries for this plant become stale and are skipped when popped
+        self.deadlines[plant] = deadline
+        heapq.heappush(self.queue, (deadline, next(self.order), plant))
+
+    def unschedule(self, plant):
+        """Forget a plant's pending event"""
+        self.deadlines.pop(plant, None)
+
+    def pop_due(self, current_time):
+        """Remove and return every plant whose deadline has passed"""
+        due = []
+        while self.queue and self.queue[0][0] < current_time:
+            deadline, _, plant = heapq.heappop(self.queue)
+            if self.deadlines.get(plant) != deadline:
+                continue  # Stale entry
+            del self.deadlines[plant]
+            due.append(plant)
+        return due
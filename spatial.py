@@ -0,0 +1,146 @@
+import bisect
+import itertools
+import math
+
+class SpatialGrid:
+    """Uniform grid that buckets objects by position for fast range queries"""
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> {object: (x, y)}
+        self.locations = {}  # object -> (cell_x, cell_y)
+
+    def __len__(self):
+        return len(self.locations)
+
+    def __contains__(self, obj):
+        return obj in self.locations
+
+    def cell_of(self, x, y):
+        """Return the grid cell containing the point (x, y)"""
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, obj, x, y):
+        """Add an object at (x, y), moving it if it is already indexed"""
+        if obj in self.locations:
+            self.remove(obj)
+        cell = self.cell_of(x, y)
+        # Dicts keep insertion order, so queries are deterministic and removal is O(1)
+        self.cells.setdefault(cell, {})[obj] = (x, y)
+        self.locations[obj] = cell
+
+    def remove(self, obj):
+        """Remove an object from the grid if it is indexed"""
+        cell = self.locations.pop(obj, None)
+        if cell is None:
+            return
+        bucket = self.cells[cell]
+        del bucket[obj]
+        if not bucket:
+            del self.cells[cell]
+
+    def clear(self):
+        """Remove every object"""
+        self.cells.clear()
+        self.locations.clear()
+
+    def query_rect(self, left, top, right, bottom):
+        """Yield (object, x, y) for every object inside the rectangle"""
+        min_x, min_y = self.cell_of(left, top)
+        max_x, max_y = self.cell_of(right, bottom)
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                bucket = self.cells.get((cell_x, cell_y))
+                if not bucket:
+                    continue
+                for obj, (x, y) in bucket.items():
+                    if left <= x <= right and top <= y <= bottom:
+                        yield obj, x, y
+
+    def query_radius(self, x, y, radius):
+        """Yield (object, distance_squared) for every object within radius of (x, y)"""
+        radius_squared = radius * radius
+        for obj, obj_x, obj_y in self.query_rect(x - radius, y - radius, x + radius, y + radius):
+            dx = obj_x - x
+            dy = obj_y - y
+            distance_squared = dx * dx + dy * dy
+            if distance_squared <= radius_squared:
+                yield obj, distance_squared
+
+class SortedIndex:
+    """Objects kept sorted by x for fast range queries along one axis
+
+    Meant for objects that rarely move, like plants: inserting shifts a list,
+    while a range query is just two binary searches. extend adds many objects
+    with a single sort. Removing only leaves a tombstone, so removing many
+    objects at once stays linear; tombstones are swept out once they make up
+    half the list. Objects at the same x stay in insertion order.
+    """
+    def __init__(self):
+        self.keys = []  # Sorted (x, order) pairs
+        self.objects = []  # Object for each key, or None for a removed one
+        self.entries = {}  # object -> its key
+        self.order = itertools.count()
+        self.removed = 0  # Tombstones in objects
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, obj):
+        return obj in self.entries
+
+    def insert(self, obj, x):
+        """Add an object at x, moving it if it is already indexed"""
+        if obj in self.entries:
+            self.remove(obj)
+        key = (x, next(self.order))
+        i = bisect.bisect(self.keys, key)
+        self.keys.insert(i, key)
+        self.objects.insert(i, obj)
+        self.entries[obj] = key
+
+    def extend(self, items):
+        """Add many (object, x) pairs with one sort instead of an insert each"""
+        items = list(items)
+        for obj, _ in items:
+            if obj in self.entries:
+                self.remove(obj)
+        if self.removed:
+            self.compact()
+        added = [((x, next(self.order)), obj) for obj, x in items]
+        self.entries.update((obj, key) for key, obj in added)
+        # Keys are unique, so objects are never compared
+        merged = sorted(list(zip(self.keys, self.objects)) + added)
+        self.keys = [key for key, _ in merged]
+        self.objects = [obj for _, obj in merged]
+
+    def remove(self, obj):
+        """Remove an object if it is indexed"""
+        key = self.entries.pop(obj, None)
+        if key is None:
+            return
+        self.objects[bisect.bisect_left(self.keys, key)] = None
+        self.removed += 1
+        if self.removed * 2 > len(self.keys):
+            self.compact()
+
+    def compact(self):
+        """Drop the tombstones left by removed objects"""
+        live = [i for i, obj in enumerate(self.objects) if obj is not None]
+        self.keys = [self.keys[i] for i in live]
+        self.objects = [self.objects[i] for i in live]
+        self.removed = 0
+
+    def clear(self):
+        """Remove every object"""
+        self.keys.clear()
+        self.objects.clear()
+        self.entries.clear()
+        self.removed = 0
+
+    def query_range(self, left, right):
+        """Return the objects with left <= x <= right, sorted by x"""
+        start = bisect.bisect_left(self.keys, (left,))
+        end = bisect.bisect_right(self.keys, (right, math.inf))
+        if not self.removed:
+            return self.objects[start:end]
+        return [obj for obj in self.objects[start:end] if obj is not None]
@@ -0,0 +1,103 @@
+import pygame
+from collections import OrderedDict
+
+def to_display_format(surface):
+    """Convert surface to the display's pixel format when there is a display, which makes blits much faster
+
+    Surfaces with per-pixel alpha keep it; others, including colour-keyed ones, are converted without.
+    """
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surface.convert_alpha() if surface.get_flags() & pygame.SRCALPHA else surface.convert()
+    return surface
+
+class SpriteCache:
+    """Bounded LRU cache of pre-rendered sprite surfaces"""
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.sprites = OrderedDict()
+
+        # Counters for checking how well the cache is working
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self):
+        """A cache with no room is treated as switched off"""
+        return self.max_size > 0
+
+    def get(self, key, render):
+        """Return the sprite for key, calling render() to build it on a miss"""
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return sprite
+
+        self.misses += 1
+        sprite = to_display_format(render())
+
+        self.sprites[key] = sprite
+        # Evict the least recently used sprites once we go over the limit
+        while len(self.sprites) > self.max_size:
+            self.sprites.popitem(last=False)
+            self.evictions += 1
+        return sprite
+
+    def clear(self):
+        """Drop every cached sprite and reset the counters"""
+        self.sprites.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        """Return the cache counters as a dictionary"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.sprites),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+class SeedAtlas:
+    """Pre-rendered seed sprites for every seed type and rotation bucket"""
+    def __init__(self, render, plant_types, rotation_buckets):
+        self.render = render  # render(plant_type, angle) -> Surface centered on the seed
+        self.plant_types = plant_types
+        self.rotation_buckets = rotation_buckets
+        self.sprites = {}
+
+    def build(self):
+        """Render all known seed types up front (call once the display exists)"""
+        self.sprites.clear()
+        for plant_type in self.plant_types:
+            for bucket in range(self.rotation_buckets):
+                self.add(plant_type, bucket)
+
+    def bucket(self, rotation):
+        """Map a rotation in degrees onto one of the rotation buckets"""
+        return int(rotation % 360 * self.rotation_buckets // 360)
+
+    def add(self, plant_type, bucket):
+        """Render a single atlas entry"""
+        sprite = to_display_format(self.render(plant_type, bucket * 360 / self.rotation_buckets))
+        # Store the blit offset with the sprite so drawing needs no extra maths
+        entry = (sprite, sprite.get_width() // 2, sprite.get_height() // 2)
+        self.sprites[(plant_type, bucket)] = entry
+        return entry
+
+    def get(self, plant_type, bucket):
+        """Return (sprite, half_width, half_height), rendering unknown types on demand"""
+        entry = self.sprites.get((plant_type, bucket))
+        if entry is None:
+            entry = self.add(plant_type, bucket)
+        return entry
+
+    def draw(self, surface, plant_type, bucket, x, y):
+        """Blit a seed sprite centered on (x, y)"""
+        sprite, half_width, half_height = self.get(plant_type, bucket)
+        surface.blit(sprite, (x - half_width, y - half_height))
@@ -0,0 +1,148 @@
+"""Run many independent headless gardens with different growth parameters
+
+Every combination of growth time, lifetime range and seed yield is run
+--replicates times with its own random seed. Runs are spread over a process
+pool and each finished run is appended to a CSV file straight away, so an
+interrupted sweep picks up where it stopped when run again with the same
+arguments; a row cut short by the interruption is dropped and run again.
+"""
+import argparse
+import csv
+import itertools
+import multiprocessing
+import os
+import random
+import zlib
+from constants import NATURAL_GROWTH_TIME, PLANT_LIFETIME, PLANT_TYPES, SEED_YIELD
+from headless import HeadlessSimulation, schedule_care
+from plant import BasePlant
+
+def parse_range(text):
+    """Turn "30-60" into (30, 60)"""
+    low, _, high = text.partition("-")
+    return (int(low), int(high or low))
+
+def run_id(growth_time, lifetime_range, seed_yield, replicate):
+    """Name identifying one run; finished runs are looked up by it when resuming"""
+    return (f"growth{growth_time:g}_life{lifetime_range[0]}-{lifetime_range[1]}"
+            f"_yield{seed_yield[0]}-{seed_yield[1]}_rep{replicate}")
+
+def sample_times(duration, sample_interval):
+    """Simulated times at which the population is recorded"""
+    count = int(duration // sample_interval)
+    return [sample_interval * (i + 1) for i in range(count)]
+
+def columns(duration, sample_interval):
+    """CSV header for a sweep"""
+    return (["run_id", "growth_time", "lifetime_min", "lifetime_max", "seed_yield_min", "seed_yield_max",
+             "replicate", "seed", "plants", "alive", "seeds_on_plants"]
+            + [f"seeds_{plant_type}" for plant_type in PLANT_TYPES]
+            + [f"alive_at_{at:g}" for at in sample_times(duration, sample_interval)])
+
+def run_garden(run):
+    """Worker: simulate one garden and return its CSV row as a dictionary"""
+    # Parameters are class attributes of the base class, so they apply to every plant this process creates
+    BasePlant.growth_time = run["growth_time"]
+    BasePlant.lifetime_range = run["lifetime_range"]
+    BasePlant.seed_yield = run["seed_yield"]
+    simulation = HeadlessSimulation(dt=run["dt"], seed=run["seed"])
+    schedule_care(simulation, run["plants"], run["care_interval"], run["duration"], random.Random(run["seed"]))
+    row = {
+        "run_id": run["run_id"],
+        "growth_time": run["growth_time"],
+        "lifetime_min": run["lifetime_range"][0],
+        "lifetime_max": run["lifetime_range"][1],
+        "seed_yield_min": run["seed_yield"][0],
+        "seed_yield_max": run["seed_yield"][1],
+        "replicate": run["replicate"],
+        "seed": run["seed"],
+    }
+    # Population over time
+    for at in sample_times(run["duration"], run["sample_interval"]):
+        simulation.run(at - simulation.time)
+        row[f"alive_at_{at:g}"] = simulation.summary()["alive"]
+    simulation.run(run["duration"] - simulation.time)
+
+    summary = simulation.summary()
+    row["plants"] = summary["plants"]
+    row["alive"] = summary["alive"]
+    row["seeds_on_plants"] = summary["seeds_on_plants"]
+    for plant_type, count in summary["seeds_collected"].items():
+        row[f"seeds_{plant_type}"] = count
+    return row
+
+def finished_rows(path, header):
+    """Complete rows already in the CSV file by run id; the file must have been written with the same header"""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return {}
+    with open(path, newline="") as file:
+        reader = csv.DictReader(file)
+        if reader.fieldnames != header:
+            raise SystemExit(f"{path} was written by a sweep with different columns; use another --output")
+        # A row cut short by an interruption is missing columns; its run is done again
+        return {row["run_id"]: row for row in reader if all(row[name] not in (None, "") for name in header)}
+
+def rewrite_rows(path, header, rows):
+    """Replace the CSV file with just the header and rows, so partial rows do not stay behind"""
+    temporary = path + ".tmp"
+    with open(temporary, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=header)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(temporary, path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep growth parameters over many headless gardens")
+    parser.add_argument("--growth-times", type=float, nargs="+", default=[NATURAL_GROWTH_TIME],
+                        help="seconds between natural growth stages")
+    parser.add_argument("--lifetimes", type=parse_range, nargs="+", default=[PLANT_LIFETIME],
+                        help="lifetime ranges after maturity, like 30-60")
+    parser.add_argument("--yields", type=parse_range, nargs="+", default=[SEED_YIELD],
+                        help="seed yield ranges, like 2-4")
+    parser.add_argument("--replicates", type=int, default=10, help="runs per parameter combination")
+    parser.add_argument("--duration", type=float, default=600, help="simulated seconds per run")
+    parser.add_argument("--dt", type=float, default=1/10, help="simulated seconds per step")
+    parser.add_argument("--plants", type=int, default=20, help="random seeds planted at the start of a run")
+    parser.add_argument("--care-interval", type=float, default=0,
+                        help="seconds between water/sun presses (default 0: the garden is left alone)")
+    parser.add_argument("--sample-interval", type=float, default=60, help="seconds between population samples")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="worker processes")
+    parser.add_argument("--output", default="sweep.csv", help="CSV file to append results to")
+    args = parser.parse_args()
+
+    header = columns(args.duration, args.sample_interval)
+    done = finished_rows(args.output, header)
+    runs = []
+    for growth_time, lifetime_range, seed_yield, replicate in itertools.product(
+            args.growth_times, args.lifetimes, args.yields, range(args.replicates)):
+        name = run_id(growth_time, lifetime_range, seed_yield, replicate)
+        if name in done:
+            continue
+        runs.append({
+            "run_id": name,
+            "growth_time": growth_time,
+            "lifetime_range": lifetime_range,
+            "seed_yield": seed_yield,
+            "replicate": replicate,
+            "seed": zlib.crc32(name.encode()),  # Same seed for the same run every time
+            "duration": args.duration,
+            "dt": args.dt,
+            "plants": args.plants,
+            "care_interval": args.care_interval,
+            "sample_interval": args.sample_interval,
+        })
+    print(f"{len(done)} runs already finished, {len(runs)} to go")
+
+    # Start from the finished rows alone, so a run cut short is not in the file twice
+    rewrite_rows(args.output, header, done.values())
+    with open(args.output, "a", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=header)
+        # maxtasksperchild=1 gives every run a fresh process, so nothing leaks between runs
+        with multiprocessing.Pool(args.workers, maxtasksperchild=1) as pool:
+            for finished, row in enumerate(pool.imap_unordered(run_garden, runs), 1):
+                writer.writerow(row)
+                file.flush()  # Finished rows survive an interruption
+                print(f"[{finished}/{len(runs)}] {row['run_id']}")
+
+if __name__ == "__main__":
+    main()
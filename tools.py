@@ -1,5 +1,6 @@
 import pygame
-from plant import Seed
+from plant import seed_atlas
+from sprites import to_display_format
 
 class ToolBar:
     def __init__(self, width, height, x, y):
@@ -36,6 +37,14 @@ class ToolBar:
         
         # Font for counting seeds
         self.font = pygame.font.SysFont(None, 20)  # Default font, size 20
+        
+        # Pre-rendered images: static chrome, one per seed slot, and count text by value
+        self.chrome = None  # Rendered on first draw, once the display exists
+        self.slot_images = {}  # seed type -> (count it shows, surface)
+        self.count_glyphs = {}
+        
+        # Areas changed since the last draw, for dirty-rect rendering
+        self.dirty_rects = [self.rect]
     
     def check_click(self, pos):
         """Check if any tool was clicked and return which one"""
@@ -56,72 +65,116 @@ class ToolBar:
     def add_seed(self, seed_type):
         """Add a seed to the count"""
         self.seed_counts[seed_type] += 1
+        self.mark_slot_dirty(seed_type)
         
     def remove_seed(self, seed_type):
         """Remove a seed from the count if available"""
         if self.seed_counts[seed_type] > 0:
             self.seed_counts[seed_type] -= 1
+            self.mark_slot_dirty(seed_type)
             return True
         return False
     
-    def draw(self, surface, collected_seeds):
-        """Draw the toolbar and all tools"""
+    def mark_slot_dirty(self, seed_type):
+        """Remember that a seed slot needs redrawing"""
+        for slot in self.seed_slots:
+            if slot["type"] == seed_type:
+                self.dirty_rects.append(slot["rect"])
+    
+    def take_dirty_rects(self):
+        """Return the areas changed since the last call and start a new list"""
+        rects = self.dirty_rects
+        self.dirty_rects = []
+        return rects
+    
+    def render_chrome(self):
+        """Render the parts of the toolbar that never change into one surface"""
+        chrome = pygame.Surface((self.width, self.height))
+        # Work in toolbar-local coordinates
+        water_button = self.water_button.move(-self.x, -self.y)
+        sun_button = self.sun_button.move(-self.x, -self.y)
+        scissors_button = self.scissors_button.move(-self.x, -self.y)
+        
         # Draw toolbar background
-        pygame.draw.rect(surface, self.bg_color, self.rect)
+        chrome.fill(self.bg_color)
         
         # Draw water button
-        pygame.draw.rect(surface, self.water_color, self.water_button)
+        pygame.draw.rect(chrome, self.water_color, water_button)
         # Add water drop icon
         drop_points = [
-            (self.water_button.centerx, self.water_button.top + 10),
-            (self.water_button.centerx - 10, self.water_button.centery),
-            (self.water_button.centerx + 10, self.water_button.centery)
+            (water_button.centerx, water_button.top + 10),
+            (water_button.centerx - 10, water_button.centery),
+            (water_button.centerx + 10, water_button.centery)
         ]
-        pygame.draw.polygon(surface, (100, 100, 255), drop_points)
-        pygame.draw.circle(surface, (100, 100, 255), 
-                          (self.water_button.centerx, self.water_button.centery + 5), 
+        pygame.draw.polygon(chrome, (100, 100, 255), drop_points)
+        pygame.draw.circle(chrome, (100, 100, 255), 
+                          (water_button.centerx, water_button.centery + 5), 
                           10)
         
         # Draw sun button
-        pygame.draw.rect(surface, self.sun_color, self.sun_button)
+        pygame.draw.rect(chrome, self.sun_color, sun_button)
         # Add sun icon (circle with rays)
-        pygame.draw.circle(surface, (255, 200, 0), 
-                          (self.sun_button.centerx, self.sun_button.centery), 
+        pygame.draw.circle(chrome, (255, 200, 0), 
+                          (sun_button.centerx, sun_button.centery), 
                           15)
         
         # Draw scissors button
-        pygame.draw.rect(surface, self.scissors_color, self.scissors_button)
+        pygame.draw.rect(chrome, self.scissors_color, scissors_button)
         # Add scissors icon (simple X shape)
         scissors_color = (80, 80, 100)
         line_length = 12
-        center_x = self.scissors_button.centerx
-        center_y = self.scissors_button.centery
+        center_x = scissors_button.centerx
+        center_y = scissors_button.centery
         # Draw the X shape
-        pygame.draw.line(surface, scissors_color, 
+        pygame.draw.line(chrome, scissors_color, 
                         (center_x - line_length, center_y - line_length),
                         (center_x + line_length, center_y + line_length), 4)
-        pygame.draw.line(surface, scissors_color, 
+        pygame.draw.line(chrome, scissors_color, 
                         (center_x + line_length, center_y - line_length),
                         (center_x - line_length, center_y + line_length), 4)
         # Draw handles
-        pygame.draw.circle(surface, scissors_color, 
+        pygame.draw.circle(chrome, scissors_color, 
                           (center_x - line_length - 3, center_y - line_length - 3), 5)
-        pygame.draw.circle(surface, scissors_color, 
+        pygame.draw.circle(chrome, scissors_color, 
                           (center_x + line_length + 3, center_y - line_length - 3), 5)
+        return to_display_format(chrome)
+    
+    def count_glyph(self, count):
+        """Rendered text for a seed count, rendered once per value"""
+        glyph = self.count_glyphs.get(count)
+        if glyph is None:
+            glyph = self.font.render(str(count), True, (255, 255, 255))
+            self.count_glyphs[count] = glyph
+        return glyph
+    
+    def slot_image(self, slot):
+        """Rendered seed slot, re-rendered only when its seed count changed"""
+        seed_type = slot["type"]
+        count = self.seed_counts[seed_type]
+        cached = self.slot_images.get(seed_type)
+        if cached is not None and cached[0] == count:
+            return cached[1]
+        
+        rect = slot["rect"]
+        image = pygame.Surface(rect.size)
+        image.fill((100, 80, 60))  # Brown slot
+        if count > 0:
+            # Draw an unrotated seed icon from the atlas in the slot
+            seed_atlas.draw(image, seed_type, 0, rect.width // 2, rect.height // 2)
+            
+            # Draw seed count
+            count_text = self.count_glyph(count)
+            image.blit(count_text, count_text.get_rect(topright=(rect.width - 2, 2)))
+        image = to_display_format(image)
+        self.slot_images[seed_type] = (count, image)
+        return image
+    
+    def draw(self, surface, collected_seeds):
+        """Draw the toolbar and all tools"""
+        if self.chrome is None:
+            self.chrome = self.render_chrome()
+        surface.blit(self.chrome, self.rect)
         
         # Draw seed slots
         for slot in self.seed_slots:
-            pygame.draw.rect(surface, (100, 80, 60), slot["rect"])  # Brown slot
-            
-            seed_type = slot["type"]
-            if self.seed_counts[seed_type] > 0:
-                # Create a temporary seed for display
-                temp_seed = Seed(seed_type)
-                
-                # Draw seed in the slot
-                temp_seed.draw_at_position(surface, slot["rect"].centerx, slot["rect"].centery)
-                
-                # Draw seed count
-                count_text = self.font.render(str(self.seed_counts[seed_type]), True, (255, 255, 255))
-                count_rect = count_text.get_rect(topright=(slot["rect"].right - 2, slot["rect"].top + 2))
-                surface.blit(count_text, count_rect)
\ No newline at end of file
+            surface.blit(self.slot_image(slot), slot["rect"])